@@ -12,6 +12,7 @@ from flask import (
     Flask, render_template, request, session, g, current_app
 )
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import inspect as sa_inspect
 from flask_migrate import Migrate
 from flask_login import LoginManager, current_user
 from flask_mail import Mail
@@ -22,6 +23,7 @@ from logging.handlers import TimedRotatingFileHandler
 from config import Config
 from app.mcp import init_app as init_mcp
 from app.utils.i18n import PoFallbackDomain
+from app.utils.schema import probe_fk_actions
 
 # ───────── Extensions ───────── #
 db = SQLAlchemy()
@@ -51,6 +53,10 @@ def create_app():
     app.config.setdefault("LANGUAGES", ["en", "el"])
     app.config.setdefault("BABEL_DEFAULT_LOCALE", "en")
     app.config.setdefault("BABEL_TRANSLATION_DIRECTORIES", "translations")
+    app.config.setdefault(
+        "TICKETS_UPLOAD_FOLDER", os.path.join(app.instance_path, "tickets_uploads")
+    )
+    os.makedirs(app.config["TICKETS_UPLOAD_FOLDER"], exist_ok=True)
 
     # ───────── Init extensions ───────── #
     db.init_app(app)
@@ -224,9 +230,16 @@ def create_app():
         FleetFileTransfer.__table__.create(bind=db.engine, checkfirst=True)
         TicketArchive.__table__.create(bind=db.engine, checkfirst=True)
 
+        # backup_job is not mapped; probe the catalog once instead of on every user deletion.
+        app.config["HAS_BACKUP_JOB_TABLE"] = sa_inspect(db.engine).has_table("backup_job")
+        # Cleanup code skips manual deletes only for FK actions the live schema enforces.
+        app.config["FK_ON_DELETE_ACTIONS"] = probe_fk_actions(db.engine)
+
     from app.email2ticket import init_app as init_email2ticket
+    from app.tickets.teams import init_app as init_teams_dispatcher
 
     init_email2ticket(app)
+    init_teams_dispatcher(app)
 
     # ───────── Logging ───────── #
     os.makedirs("logs", exist_ok=True)
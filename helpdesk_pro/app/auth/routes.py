@@ -73,7 +73,7 @@ def forgot_password():
         email = (request.form.get("email") or "").strip().lower()
         if email:
             user = (
-                User.query.filter(func.lower(User.email) == email)
+                User.query.filter(User.email == email)
                 .filter(User.active.is_(True))
                 .first()
             )
@@ -120,7 +120,7 @@ def register():
             errors.append(_("Email is required."))
         if User.query.filter(func.lower(User.username) == username.lower()).first():
             errors.append(_("Username is already taken."))
-        if User.query.filter(func.lower(User.email) == email).first():
+        if User.query.filter(User.email == email).first():
             errors.append(_("An account with that email already exists."))
         ok, password_errors = validate_password_strength(password)
         if not ok:
@@ -198,7 +198,7 @@ def setup_admin():
     if request.method == "POST":
         username = (request.form.get("username") or "").strip()
         password = request.form.get("password") or ""
-        email = (request.form.get("email") or "").strip()
+        email = (request.form.get("email") or "").strip().lower()
         full_name = (request.form.get("full_name") or "").strip()
 
         errors = []
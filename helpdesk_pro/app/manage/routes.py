@@ -48,7 +48,7 @@ from app.permissions import (
 from app.mcp import start_mcp_server, stop_mcp_server, refresh_mcp_settings
 from dotenv import dotenv_values, load_dotenv, set_key, unset_key
 from config import Config
-from app.tickets.archive_utils import build_archive_from_ticket
+from app.tickets.archive_utils import archive_tickets_bulk
 
 
 manage_bp = Blueprint("manage", __name__, url_prefix="/manage")
@@ -1185,15 +1185,13 @@ def ticket_archives():
             flash(_("Select a valid archive window."), "danger")
             return redirect(url_for("manage.ticket_archives"))
         cutoff = datetime.utcnow() - window_map[scope]
-        tickets_query = Ticket.query.filter(Ticket.created_at <= cutoff).filter(Ticket.status == "Closed")
-        tickets = tickets_query.all()
-        archived = 0
-        for ticket in tickets:
-            archive_entry = build_archive_from_ticket(ticket, current_user.id)
-            db.session.add(archive_entry)
-            db.session.delete(ticket)
-            archived += 1
-        db.session.commit()
+        ticket_ids = [
+            row.id
+            for row in db.session.query(Ticket.id)
+            .filter(Ticket.created_at <= cutoff)
+            .filter(Ticket.status == "Closed")
+        ]
+        archived = archive_tickets_bulk(ticket_ids, current_user.id)
         flash(
             _("Archived %(count)s ticket(s) older than %(window)s.", count=archived, window=scope),
             "success" if archived else "info",
@@ -18,7 +18,7 @@ class ApiClient(db.Model):
     name = db.Column(db.String(120), nullable=False)
     prefix = db.Column(db.String(16), nullable=False, unique=True)
     key_hash = db.Column(db.String(128), nullable=False)
-    default_user_id = db.Column(db.Integer, db.ForeignKey("user.id"))
+    default_user_id = db.Column(db.Integer, db.ForeignKey("user.id", ondelete="SET NULL"))
     description = db.Column(db.String(255))
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
     last_used_at = db.Column(db.DateTime)
@@ -519,7 +519,7 @@ class AssistantSession(db.Model):
         db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     user = db.relationship("User", backref=db.backref(
-        "assistant_sessions", lazy="dynamic"))
+        "assistant_sessions", lazy="dynamic", passive_deletes=True))
 
     def touch(self):
         self.updated_at = datetime.utcnow()
@@ -127,7 +127,7 @@ class TapeLocation(db.Model):
     check_out_at = db.Column(db.DateTime, nullable=True)
     notes = db.Column(db.Text, nullable=True)
     is_current = db.Column(db.Boolean, default=True, nullable=False)
-    created_by_user_id = db.Column(db.Integer, db.ForeignKey("user.id"), nullable=True)
+    created_by_user_id = db.Column(db.Integer, db.ForeignKey("user.id", ondelete="SET NULL"), nullable=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
 
     tape = db.relationship(
@@ -170,7 +170,7 @@ class TapeCustodyEvent(db.Model):
     received_by = db.Column(db.String(120), nullable=True)
     received_signature = db.Column(db.String(120), nullable=True)
     notes = db.Column(db.Text, nullable=True)
-    created_by_user_id = db.Column(db.Integer, db.ForeignKey("user.id"), nullable=True)
+    created_by_user_id = db.Column(db.Integer, db.ForeignKey("user.id", ondelete="SET NULL"), nullable=True)
 
     tape = db.relationship(
         "TapeCartridge",
@@ -202,7 +202,7 @@ class BackupAuditLog(db.Model):
     old_value = db.Column(db.Text, nullable=True)
     new_value = db.Column(db.Text, nullable=True)
     reason = db.Column(db.Text, nullable=True)
-    changed_by_user_id = db.Column(db.Integer, db.ForeignKey("user.id"), nullable=True)
+    changed_by_user_id = db.Column(db.Integer, db.ForeignKey("user.id", ondelete="SET NULL"), nullable=True)
     changed_by_username = db.Column(db.String(120), nullable=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
 
@@ -18,7 +18,7 @@ class ChatConversation(db.Model):
     name = db.Column(db.String(150))
     is_direct = db.Column(db.Boolean, default=False)
     is_bot = db.Column(db.Boolean, default=False, nullable=False)
-    created_by = db.Column(db.Integer, db.ForeignKey("user.id"))
+    created_by = db.Column(db.Integer, db.ForeignKey("user.id", ondelete="SET NULL"))
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
@@ -50,7 +50,7 @@ class ChatMembership(db.Model):
         db.ForeignKey("chat_conversation.id", ondelete="CASCADE"),
         nullable=False,
     )
-    user_id = db.Column(db.Integer, db.ForeignKey("user.id"), nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey("user.id", ondelete="CASCADE"), nullable=False)
     added_at = db.Column(db.DateTime, default=datetime.utcnow)
 
     __table_args__ = (
@@ -70,7 +70,7 @@ class ChatMessage(db.Model):
         db.ForeignKey("chat_conversation.id", ondelete="CASCADE"),
         nullable=False,
     )
-    sender_id = db.Column(db.Integer, db.ForeignKey("user.id"), nullable=False)
+    sender_id = db.Column(db.Integer, db.ForeignKey("user.id", ondelete="CASCADE"), nullable=False)
     _body = db.Column("body", db.Text)
     attachment_filename = db.Column(db.String(255))
     attachment_original = db.Column(db.String(255))
@@ -120,7 +120,7 @@ class ChatMessageRead(db.Model):
         db.ForeignKey("chat_message.id", ondelete="CASCADE"),
         nullable=False,
     )
-    user_id = db.Column(db.Integer, db.ForeignKey("user.id"), nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey("user.id", ondelete="CASCADE"), nullable=False)
     read_at = db.Column(db.DateTime, default=datetime.utcnow)
 
     __table_args__ = (
@@ -135,12 +135,13 @@ class ChatFavorite(db.Model):
     __tablename__ = "chat_favorite"
 
     id = db.Column(db.Integer, primary_key=True)
-    user_id = db.Column(db.Integer, db.ForeignKey("user.id"), nullable=False)
-    favorite_user_id = db.Column(db.Integer, db.ForeignKey("user.id"), nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey("user.id", ondelete="CASCADE"), nullable=False)
+    favorite_user_id = db.Column(db.Integer, db.ForeignKey("user.id", ondelete="CASCADE"), nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
     __table_args__ = (
         db.UniqueConstraint("user_id", "favorite_user_id", name="uq_chat_favorite"),
+        db.Index("ix_chat_favorite_favorite_user_id", "favorite_user_id"),
     )
 
     def __repr__(self):
@@ -28,7 +28,7 @@ class Contract(db.Model):
     start_date = db.Column(db.Date)
     end_date = db.Column(db.Date)
     renewal_date = db.Column(db.Date)
-    owner_id = db.Column(db.Integer, db.ForeignKey("user.id"), nullable=True)
+    owner_id = db.Column(db.Integer, db.ForeignKey("user.id", ondelete="SET NULL"), nullable=True)
     support_email = db.Column(db.String(150))
     support_phone = db.Column(db.String(80))
     support_url = db.Column(db.String(255))
@@ -36,7 +36,7 @@ class Contract(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
-    owner = db.relationship("User", foreign_keys=[owner_id], backref="contracts")
+    owner = db.relationship("User", foreign_keys=[owner_id], backref=db.backref("contracts", passive_deletes=True))
 
     def to_dict(self):
         return {
@@ -32,7 +32,7 @@ class EmailIngestConfig(db.Model):
     poll_interval_seconds = db.Column(db.Integer, default=300, nullable=False)
 
     created_by_user_id = db.Column(db.Integer, db.ForeignKey("user.id"), nullable=True)
-    assign_to_user_id = db.Column(db.Integer, db.ForeignKey("user.id"), nullable=True)
+    assign_to_user_id = db.Column(db.Integer, db.ForeignKey("user.id", ondelete="SET NULL"), nullable=True)
     default_priority = db.Column(db.String(50))
     default_department = db.Column(db.String(120))
     subject_filter_enabled = db.Column(db.Boolean, default=False, nullable=False)
@@ -33,7 +33,7 @@ class SoftwareAsset(db.Model):
     support_email = db.Column(db.String(150))
     support_phone = db.Column(db.String(80))
     contract_url = db.Column(db.String(255))
-    assigned_to = db.Column(db.Integer, db.ForeignKey("user.id"), nullable=True)
+    assigned_to = db.Column(db.Integer, db.ForeignKey("user.id", ondelete="SET NULL"), nullable=True)
     assigned_on = db.Column(db.Date)
     usage_scope = db.Column(db.String(150))
     deployment_notes = db.Column(db.Text)
@@ -42,7 +42,7 @@ class SoftwareAsset(db.Model):
         db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     assignee = db.relationship(
-        "User", foreign_keys=[assigned_to], backref="software_assets")
+        "User", foreign_keys=[assigned_to], backref=db.backref("software_assets", passive_deletes=True))
 
     def to_dict(self):
         return {
@@ -105,7 +105,7 @@ class HardwareAsset(db.Model):
     warranty_end = db.Column(db.Date)
     support_vendor = db.Column(db.String(150))
     support_contract = db.Column(db.String(150))
-    assigned_to = db.Column(db.Integer, db.ForeignKey("user.id"), nullable=True)
+    assigned_to = db.Column(db.Integer, db.ForeignKey("user.id", ondelete="SET NULL"), nullable=True)
     assigned_on = db.Column(db.Date)
     accessories = db.Column(db.String(255))
     power_supply = db.Column(db.String(120))
@@ -117,7 +117,7 @@ class HardwareAsset(db.Model):
         db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     assignee = db.relationship(
-        "User", foreign_keys=[assigned_to], backref="hardware_assets")
+        "User", foreign_keys=[assigned_to], backref=db.backref("hardware_assets", passive_deletes=True))
 
     def to_dict(self):
         return {
@@ -110,7 +110,7 @@ class KnowledgeAttachment(db.Model):
     mimetype = db.Column(db.String(120))
     file_size = db.Column(db.Integer)
     extracted_text = db.Column(db.Text)
-    uploaded_by = db.Column(db.Integer, db.ForeignKey("user.id"))
+    uploaded_by = db.Column(db.Integer, db.ForeignKey("user.id", ondelete="SET NULL"))
     uploaded_at = db.Column(db.DateTime, default=datetime.utcnow)
 
     def file_path(self, upload_folder):
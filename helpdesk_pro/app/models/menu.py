@@ -14,7 +14,7 @@ class MenuPermission(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     menu_key = db.Column(db.String(64), nullable=False)
     role = db.Column(db.String(20))
-    user_id = db.Column(db.Integer, db.ForeignKey("user.id"), nullable=True)
+    user_id = db.Column(db.Integer, db.ForeignKey("user.id", ondelete="CASCADE"), nullable=True)
     allowed = db.Column(db.Boolean, default=True, nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
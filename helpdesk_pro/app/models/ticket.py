@@ -23,20 +23,20 @@ class Ticket(db.Model):
     created_by = db.Column(
         db.Integer, db.ForeignKey("user.id"), nullable=False)
     assigned_to = db.Column(
-        db.Integer, db.ForeignKey("user.id"), nullable=True)
+        db.Integer, db.ForeignKey("user.id", ondelete="SET NULL"), nullable=True)
 
     # ───────────── Relationships ───────────── #
    # Correct foreign keys
     created_by = db.Column(
         db.Integer, db.ForeignKey("user.id"), nullable=False)
     assigned_to = db.Column(
-        db.Integer, db.ForeignKey("user.id"), nullable=True)
+        db.Integer, db.ForeignKey("user.id", ondelete="SET NULL"), nullable=True)
 
     # Proper relationships
     creator = db.relationship("User", foreign_keys=[
                               created_by], backref="created_tickets")
     assignee = db.relationship("User", foreign_keys=[
-                               assigned_to], backref="assigned_tickets")
+                               assigned_to], backref=db.backref("assigned_tickets", passive_deletes=True))
 
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(
@@ -98,6 +98,10 @@ class TicketComment(db.Model):
     comment = db.Column(db.Text)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
+    __table_args__ = (
+        db.Index("ix_ticket_comment_ticket_created", "ticket_id", "created_at"),
+    )
+
     @property
     def created_at_local(self):
         """Convert UTC → Europe/Athens safely."""
@@ -122,6 +126,10 @@ class Attachment(db.Model):
     uploaded_by = db.Column(db.String(100))
     uploaded_at = db.Column(db.DateTime, default=datetime.utcnow)
 
+    __table_args__ = (
+        db.Index("ix_attachment_ticket_uploaded", "ticket_id", "uploaded_at"),
+    )
+
     @property
     def uploaded_at_local(self):
         """Convert UTC → Europe/Athens safely."""
@@ -145,6 +153,10 @@ class AuditLog(db.Model):
     )
     timestamp = db.Column(db.DateTime, default=datetime.utcnow)
 
+    __table_args__ = (
+        db.Index("ix_audit_log_ticket_timestamp", "ticket_id", "timestamp"),
+    )
+
     @property
     def timestamp_local(self):
         """Convert UTC → Europe/Athens safely."""
@@ -14,7 +14,7 @@ class User(UserMixin, db.Model):
     full_name = db.Column(db.String(150))
     password_hash = db.Column(db.String(128), nullable=False)
     role = db.Column(db.String(20), default='user')
-    department = db.Column(db.String(100))
+    department = db.Column(db.String(100), index=True)
     active = db.Column(db.Boolean, default=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     avatar_filename = db.Column(db.String(255))
@@ -23,6 +23,12 @@ class User(UserMixin, db.Model):
     notify_team_ticket_teams = db.Column(db.Boolean, default=False, nullable=False)
     teams_webhook_url = db.Column(db.String(512))
 
+    __table_args__ = (
+        db.Index("ix_user_dept_lower", db.func.lower(department)),
+        db.Index("uq_user_username_ci", db.func.lower(username), unique=True),
+        db.Index("uq_user_email_ci", db.func.lower(email), unique=True),
+    )
+
     def set_password(self, password):
         self.password_hash = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
 
@@ -38,7 +38,7 @@ def ensure_default_admin(app: Any) -> None:
         return
 
     username = _env("DEFAULT_ADMIN_USERNAME", "admin")
-    email = _env("DEFAULT_ADMIN_EMAIL", "admin@example.com")
+    email = _env("DEFAULT_ADMIN_EMAIL", "admin@example.com").lower()
     password = _env("DEFAULT_ADMIN_PASSWORD", "Admin123!")
     full_name = _env("DEFAULT_ADMIN_FULL_NAME", "System Administrator")
     department = _env("DEFAULT_ADMIN_DEPARTMENT", "IT")
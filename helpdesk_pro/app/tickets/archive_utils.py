@@ -2,10 +2,32 @@
 
 from __future__ import annotations
 
+import io
+import json
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List
 
-from app.models.ticket import Ticket, TicketArchive
+from sqlalchemy import delete
+from sqlalchemy.orm import selectinload
+
+from app import db
+from app.models.ticket import Attachment, AuditLog, Ticket, TicketArchive, TicketComment
+
+
+# Batches at least this large go through PostgreSQL COPY instead of INSERT.
+ARCHIVE_COPY_THRESHOLD = 100
+# Upper bound on tickets archived per transaction by archive_tickets_bulk.
+ARCHIVE_BATCH_SIZE = 500
+_JSON_ARCHIVE_COLUMNS = frozenset({"comments", "attachments", "logs"})
+
+
+def archive_load_options() -> List[Any]:
+    """Loader options that preload every relationship a ticket snapshot reads."""
+    return [
+        selectinload(Ticket.comments),
+        selectinload(Ticket.attachments),
+        selectinload(Ticket.logs),
+    ]
 
 
 def serialize_comments(ticket: Ticket) -> List[Dict[str, Any]]:
@@ -48,23 +70,138 @@ def serialize_logs(ticket: Ticket) -> List[Dict[str, Any]]:
     return data
 
 
+def archive_values(
+    ticket: Ticket,
+    archived_by_id: int | None,
+    archived_at: datetime | None = None,
+) -> Dict[str, Any]:
+    """Column values for a TicketArchive row capturing ``ticket``."""
+    now = datetime.utcnow()
+    return {
+        "ticket_id": ticket.id,
+        "subject": ticket.subject,
+        "description": ticket.description,
+        "priority": ticket.priority,
+        "status": ticket.status,
+        "department": ticket.department,
+        "created_by": ticket.created_by,
+        "assigned_to": ticket.assigned_to,
+        "created_at": ticket.created_at or now,
+        "updated_at": ticket.updated_at or now,
+        "closed_at": ticket.closed_at,
+        "archived_at": archived_at or now,
+        "archived_by": archived_by_id,
+        "comments": serialize_comments(ticket),
+        "attachments": serialize_attachments(ticket),
+        "logs": serialize_logs(ticket),
+    }
+
+
 def build_archive_from_ticket(ticket: Ticket, archived_by_id: int | None) -> TicketArchive:
     """Create a TicketArchive ORM object from an in-memory ticket snapshot."""
-    return TicketArchive(
-        ticket_id=ticket.id,
-        subject=ticket.subject,
-        description=ticket.description,
-        priority=ticket.priority,
-        status=ticket.status,
-        department=ticket.department,
-        created_by=ticket.created_by,
-        assigned_to=ticket.assigned_to,
-        created_at=ticket.created_at or datetime.utcnow(),
-        updated_at=ticket.updated_at or datetime.utcnow(),
-        closed_at=ticket.closed_at,
-        archived_at=datetime.utcnow(),
-        archived_by=archived_by_id,
-        comments=serialize_comments(ticket),
-        attachments=serialize_attachments(ticket),
-        logs=serialize_logs(ticket),
+    return TicketArchive(**archive_values(ticket, archived_by_id))
+
+
+def bulk_archive_tickets(tickets: Iterable[Ticket], archived_by_id: int | None) -> int:
+    """
+    Insert TicketArchive rows for a batch of tickets in one multi-row INSERT.
+
+    Load the tickets with ``archive_load_options()`` first; otherwise every
+    ticket lazy-loads its comments, attachments and logs one query at a time.
+    The caller owns the transaction and commits it.
+    """
+    archived_at = datetime.utcnow()
+    mappings = [archive_values(ticket, archived_by_id, archived_at) for ticket in tickets]
+    if not mappings:
+        return 0
+    if len(mappings) >= ARCHIVE_COPY_THRESHOLD and _copy_archive_rows(mappings):
+        return len(mappings)
+    db.session.bulk_insert_mappings(TicketArchive, mappings)
+    return len(mappings)
+
+
+def archive_tickets_bulk(
+    ticket_ids: Iterable[int], archived_by_id: int | None, batch_size: int = ARCHIVE_BATCH_SIZE
+) -> int:
+    """
+    Archive and delete tickets in chunks, committing after each chunk.
+
+    Each chunk snapshots its tickets with ``bulk_archive_tickets`` and removes
+    them, with their comments, attachments and logs, through one DELETE per
+    table, so lock windows stay bounded however many tickets are archived.
+    Attachment files stay on disk for the archive download route.
+    """
+    ids = list(ticket_ids)
+    archived = 0
+    for start in range(0, len(ids), batch_size):
+        tickets = (
+            Ticket.query.options(*archive_load_options())
+            .filter(Ticket.id.in_(ids[start:start + batch_size]))
+            .all()
+        )
+        if not tickets:
+            continue
+        archived += bulk_archive_tickets(tickets, archived_by_id)
+        found = [ticket.id for ticket in tickets]
+        # The bulk DELETEs bypass the identity map; drop the loaded rows first.
+        for ticket in tickets:
+            for child in (*ticket.comments, *ticket.attachments, *ticket.logs):
+                db.session.expunge(child)
+            db.session.expunge(ticket)
+        for model in (Attachment, TicketComment, AuditLog):
+            db.session.execute(
+                delete(model)
+                .where(model.ticket_id.in_(found))
+                .execution_options(synchronize_session=False)
+            )
+        db.session.execute(
+            delete(Ticket).where(Ticket.id.in_(found)).execution_options(synchronize_session=False)
+        )
+        db.session.commit()
+    return archived
+
+
+def _copy_csv_field(column: str, value: Any) -> str:
+    if value is None:
+        return ""
+    if column in _JSON_ARCHIVE_COLUMNS:
+        value = json.dumps(value, default=str)
+    elif isinstance(value, datetime):
+        value = value.isoformat()
+    else:
+        value = str(value)
+    # Quote every non-NULL value so empty strings stay distinct from NULL.
+    return '"' + value.replace('"', '""') + '"'
+
+
+def _copy_archive_rows(mappings: List[Dict[str, Any]]) -> bool:
+    """
+    Stream archive rows into PostgreSQL with COPY ... FROM STDIN.
+
+    Returns False without writing anything when the session is not bound to
+    PostgreSQL through psycopg2, so the caller can fall back to INSERTs.
+    """
+    connection = db.session.connection()
+    if connection.dialect.name != "postgresql":
+        return False
+    cursor = connection.connection.cursor()
+    if not hasattr(cursor, "copy_expert"):
+        cursor.close()
+        return False
+
+    columns = list(mappings[0].keys())
+    buffer = io.StringIO()
+    for row in mappings:
+        buffer.write(",".join(_copy_csv_field(column, row[column]) for column in columns))
+        buffer.write("\n")
+    buffer.seek(0)
+
+    statement = (
+        f"COPY {TicketArchive.__tablename__} ({', '.join(columns)}) "
+        "FROM STDIN WITH (FORMAT csv)"
     )
+    try:
+        cursor.copy_expert(statement, buffer)
+    finally:
+        cursor.close()
+    return True
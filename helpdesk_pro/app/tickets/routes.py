@@ -1,51 +1,229 @@
 from __future__ import annotations
 
-from sqlalchemy import or_, func
-import copy
+from sqlalchemy import String, delete, event, exists, literal, or_, func, select, true, union_all
+from sqlalchemy.orm import aliased, joinedload, load_only, selectinload
+import mmap
 import os
+import shutil
+import time
 import uuid
+from collections import namedtuple
+from dataclasses import dataclass
 from datetime import datetime
+from types import SimpleNamespace
+from typing import Any, Optional
+from urllib.parse import quote
 try:
     from zoneinfo import ZoneInfo
 except ImportError:
     from backports.zoneinfo import ZoneInfo
 
-import requests
-
-from flask import Blueprint, render_template, request, jsonify, flash, redirect, url_for, abort, current_app, send_from_directory, send_file
+from flask import Blueprint, render_template, request, jsonify, flash, redirect, url_for, abort, current_app, send_from_directory, send_file, g
 from flask_login import login_required, current_user
 from flask_babel import gettext as _
+from werkzeug.exceptions import NotFound
+from werkzeug.utils import send_from_directory as _werkzeug_send_from_directory
 from app.utils.files import secure_filename
+from app.utils.schema import fk_actions
 from flask_mail import Message
 
 from app import db, csrf
 from app.models.ticket import Ticket, TicketComment, Attachment, AuditLog, TicketArchive
 from app.models.user import User
 from app.mail_utils import queue_mail_with_optional_auth
-from app.background import submit_background_task
 from app.tickets.archive_utils import build_archive_from_ticket
+from app.tickets.teams import queue_teams_notification
 
 tickets_bp = Blueprint("tickets", __name__)
 
+TICKETS_PER_PAGE = 100
+UPLOAD_COPY_BUFFER_SIZE = 1024 * 1024
+ATTACHMENT_MMAP_THRESHOLD = 1024 * 1024
+ATTACHMENT_STREAM_CHUNK = 256 * 1024
+# Legacy attachments were stored under app static/uploads.
+STATIC_UPLOAD_DIR = os.path.join(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")),
+    "static",
+    "uploads",
+)
+_ticket_upload_folders_ready = set()
+# Stored attachment web paths -> storage location: new uploads live in the
+# instance folder, legacy ones under static/uploads.
+_ATTACHMENT_PREFIXES = (
+    ("/tickets/attachments/", "instance"),
+    ("/static/uploads/", "static"),
+)
+# Columns rendered by tickets/list.html; wide columns it never shows stay unloaded.
+_TICKET_LIST_COLUMNS = (
+    Ticket.id,
+    Ticket.subject,
+    Ticket.description,
+    Ticket.priority,
+    Ticket.status,
+    Ticket.created_by,
+    Ticket.assigned_to,
+    Ticket.created_at,
+    Ticket.closed_at,
+)
+
+_DEFAULT_NOTIFY_ROLES = frozenset({"user", "technician", "manager"})
+_NOTIFY_MANAGERS_TTL_SECONDS = 60
+_notify_managers_cache = {}
+_CommentView = namedtuple("_CommentView", "created_at user comment")
+_AttachmentView = namedtuple("_AttachmentView", "uploaded_at filename filepath uploaded_by")
+_LogView = namedtuple("_LogView", "timestamp action username")
+_NotifyManager = namedtuple(
+    "_NotifyManager",
+    "username email notify_team_ticket_email notify_team_ticket_teams teams_webhook_url",
+)
 
 def _ensure_ticket_upload_folder():
-    """Ensure instance-level tickets upload folder exists and return its path."""
+    """
+    Return the tickets upload folder.
+
+    create_app sets and creates it at boot; the fallback covers apps whose
+    config was changed afterwards, and each folder is created at most once.
+    """
     upload_folder = current_app.config.get("TICKETS_UPLOAD_FOLDER")
     if not upload_folder:
         upload_folder = os.path.join(current_app.instance_path, "tickets_uploads")
         current_app.config["TICKETS_UPLOAD_FOLDER"] = upload_folder
-    os.makedirs(upload_folder, exist_ok=True)
+    if upload_folder not in _ticket_upload_folders_ready:
+        os.makedirs(upload_folder, exist_ok=True)
+        _ticket_upload_folders_ready.add(upload_folder)
     return upload_folder
 
+
+def _attachment_kind(path_value):
+    """Return ``"instance"``, ``"static"`` or None for a stored attachment path."""
+    for prefix, kind in _ATTACHMENT_PREFIXES:
+        if path_value.startswith(prefix):
+            return kind
+    return None
+
+
+def _write_upload(storage, path):
+    """Stream an uploaded file to disk through a reused 1 MiB buffer, optionally fsynced."""
+    with open(path, "wb") as fh:
+        if hasattr(os, "posix_fadvise"):
+            try:
+                os.posix_fadvise(fh.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            except OSError:
+                pass
+        shutil.copyfileobj(storage.stream, fh, UPLOAD_COPY_BUFFER_SIZE)
+        if current_app.config.get("TICKETS_UPLOAD_FSYNC"):
+            fh.flush()
+            os.fsync(fh.fileno())
+
+
+def _unlink_in_dir(directory, names):
+    """Best-effort removal of ``names`` from ``directory`` without a stat per file."""
+    if not names:
+        return
+    dir_fd = None
+    if os.unlink in os.supports_dir_fd:
+        try:
+            dir_fd = os.open(directory, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+        except OSError:
+            return
+    try:
+        for name in names:
+            try:
+                if dir_fd is None:
+                    os.unlink(os.path.join(directory, name))
+                else:
+                    os.unlink(name, dir_fd=dir_fd)
+            except FileNotFoundError:
+                pass
+            except OSError:
+                current_app.logger.warning("Could not remove attachment file %s", name)
+    finally:
+        if dir_fd is not None:
+            os.close(dir_fd)
+
+
+def _iter_mapped_file(path, chunk_size=ATTACHMENT_STREAM_CHUNK):
+    """Yield ``path`` in chunks sliced from a read-only memory map."""
+    with open(path, "rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if hasattr(os, "posix_fadvise"):
+            try:
+                os.posix_fadvise(fh.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            except OSError:
+                pass
+        for offset in range(0, len(mm), chunk_size):
+            yield mm[offset:offset + chunk_size]
+
+
+def _send_ticket_upload(upload_folder, stored_name, download_name):
+    """
+    Send a file from the ticket upload folder.
+
+    When ``TICKETS_ACCEL_REDIRECT_PREFIX`` is set the response only carries an
+    ``X-Accel-Redirect`` header and nginx streams the file from that internal
+    location. Otherwise Werkzeug serves it through ``wsgi.file_wrapper`` when the
+    server provides one; without it, files of at least ``ATTACHMENT_MMAP_THRESHOLD``
+    bytes are streamed from a read-only mmap via ``_iter_mapped_file`` and smaller
+    ones use Werkzeug's buffered file iterator.
+    """
+    prefix = current_app.config.get("TICKETS_ACCEL_REDIRECT_PREFIX")
+    if not prefix:
+        response = send_from_directory(
+            upload_folder, stored_name, as_attachment=True, download_name=download_name
+        )
+        if (
+            response.status_code == 200
+            and "wsgi.file_wrapper" not in request.environ
+            and (response.content_length or 0) >= ATTACHMENT_MMAP_THRESHOLD
+        ):
+            # No sendfile-capable wrapper: stream large files from a shared
+            # read-only mapping instead of buffered reads per worker.
+            response.response.close()
+            response.response = _iter_mapped_file(os.path.join(upload_folder, stored_name))
+        return response
+    response = _werkzeug_send_from_directory(
+        upload_folder,
+        stored_name,
+        request.environ,
+        as_attachment=True,
+        download_name=download_name,
+        use_x_sendfile=True,
+        response_class=current_app.response_class,
+    )
+    del response.headers["X-Sendfile"]
+    response.headers["X-Accel-Redirect"] = f"{prefix.rstrip('/')}/{quote(stored_name)}"
+    return response
+
+
 LOCAL_TZ = ZoneInfo("Europe/Athens")
+_UTC = ZoneInfo("UTC")
 
 
 def to_local(dt):
-    if not dt:
+    if dt is None:
         return None
-    if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=ZoneInfo("UTC"))
-    return dt.astimezone(LOCAL_TZ)
+    return (dt.replace(tzinfo=_UTC) if dt.tzinfo is None else dt).astimezone(LOCAL_TZ)
+
+
+tickets_bp.add_app_template_filter(to_local, "local")
+
+
+@dataclass(frozen=True, slots=True)
+class _FieldView:
+    """Minimal stand-in for a WTForms field: templates only read ``.data``."""
+
+    data: Any
+
+
+def _dummy_form(t):
+    """Expose a ticket's values through the ``form.<field>.data`` shape edit.html expects."""
+    return SimpleNamespace(
+        subject=_FieldView(t.subject),
+        description=_FieldView(t.description),
+        priority=_FieldView(t.priority),
+        status=_FieldView(t.status),
+        department=_FieldView(t.department),
+        assigned_to=_FieldView(t.assigned_to),
+    )
 
 
 def _shorten(text, length=200):
@@ -57,25 +235,82 @@ def _shorten(text, length=200):
     return text[: max(0, length - 3)] + "..."
 
 
+def _ticket_touches_department(ticket, dept) -> bool:
+    """True when the ticket's creator or assignee belongs to ``dept``."""
+    member_ids = [i for i in (ticket.created_by, ticket.assigned_to) if i is not None]
+    if not member_ids or dept is None:
+        return False
+    return bool(
+        db.session.scalar(
+            select(exists().where(User.id.in_(member_ids), User.department == dept))
+        )
+    )
+
+
+def _ticket_access_clause():
+    """SQL predicate restricting tickets to those the current user may access."""
+    user = current_user._get_current_object()
+    role = user.role
+    uid = user.id
+    dept = user.department
+    if role == "admin":
+        return true()
+    own = or_(Ticket.created_by == uid, Ticket.assigned_to == uid)
+    if role == "manager":
+        dept_ids = select(User.id).where(User.department == dept)
+        return or_(own, Ticket.created_by.in_(dept_ids), Ticket.assigned_to.in_(dept_ids))
+    return own
+
+
+def _authorized_ticket(ticket_id):
+    """
+    Load a ticket only when the current user may access it.
+
+    Returns ``None`` when the ticket exists but is off-limits; aborts with 404
+    when it does not exist at all.
+    """
+    ticket = Ticket.query.filter(Ticket.id == ticket_id, _ticket_access_clause()).first()
+    if ticket is None and db.session.query(Ticket.id).filter(Ticket.id == ticket_id).first() is None:
+        abort(404)
+    g.setdefault("_ticket_access", {})[ticket_id] = ticket is not None
+    return ticket
+
+
+def _can_access_ticket(ticket_id) -> bool:
+    """Whether the current user may access ``ticket_id``; memoised per request."""
+    cache = g.setdefault("_ticket_access", {})
+    allowed = cache.get(ticket_id)
+    if allowed is None:
+        allowed = cache[ticket_id] = bool(
+            db.session.scalar(
+                select(exists().where(Ticket.id == ticket_id, _ticket_access_clause()))
+            )
+        )
+    return allowed
+
+
 def _user_can_archive_ticket(ticket: Ticket) -> bool:
-    if current_user.role == "admin":
+    user = current_user._get_current_object()
+    role = user.role
+    uid = user.id
+    if role == "admin":
         return True
-    return ticket.created_by == current_user.id or ticket.assigned_to == current_user.id
+    return ticket.created_by == uid or ticket.assigned_to == uid
 
 
 def _can_view_archive(archive: TicketArchive) -> bool:
-    if current_user.role == "admin":
+    user = current_user._get_current_object()
+    role = user.role
+    uid = user.id
+    if role == "admin":
         return True
     allowed = (
-        archive.created_by == current_user.id
-        or archive.assigned_to == current_user.id
-        or archive.archived_by == current_user.id
+        archive.created_by == uid
+        or archive.assigned_to == uid
+        or archive.archived_by == uid
     )
-    if current_user.role == "manager":
-        dept_value = current_user.department
-        dept_ids = {u.id for u in User.query.filter_by(department=dept_value).all()}
-        if archive.created_by in dept_ids or archive.assigned_to in dept_ids:
-            allowed = True
+    if not allowed and role == "manager":
+        allowed = _ticket_touches_department(archive, user.department)
     return allowed
 
 
@@ -106,30 +341,48 @@ def _ticket_url(ticket):
         return path
 
 
-def _notify_team_managers(ticket, actor, event_summary, details=None):
+def _get_notify_managers(department_key):
     """
-    Notify managers in the actor's department when a team member updates a ticket.
+    Return the opted-in active managers of a department as lightweight records.
+
+    Results are cached per process for ``_NOTIFY_MANAGERS_TTL_SECONDS`` and
+    dropped whenever a User row changes.
     """
+    now = time.time()
+    cached = _notify_managers_cache.get(department_key)
+    if cached and now - cached[0] < _NOTIFY_MANAGERS_TTL_SECONDS:
+        return cached[1]
+
+    rows = (
+        db.session.query(
+            User.username,
+            User.email,
+            User.notify_team_ticket_email,
+            User.notify_team_ticket_teams,
+            User.teams_webhook_url,
+        )
+        .filter(
+            User.role == "manager",
+            User.active.is_(True),
+            func.lower(User.department) == department_key,
+            or_(User.notify_team_ticket_email.is_(True), User.notify_team_ticket_teams.is_(True)),
+        )
+        .all()
+    )
+    managers = [_NotifyManager(*row) for row in rows]
+    _notify_managers_cache[department_key] = (now, managers)
+    return managers
 
-    if not actor or actor.role not in {"user", "technician", "manager"}:
-        return
-    department = (actor.department or "").strip()
-    if not department:
-        return
 
-    managers = (
-        User.query.filter(
-        User.role == "manager",
-        User.active.is_(True),
-        func.lower(User.department) == department.lower(),
-        or_(User.notify_team_ticket_email.is_(True), User.notify_team_ticket_teams.is_(True)),
-    ).all()
-    )
-    if not managers:
-        return
+def _invalidate_notify_managers(*_args):
+    _notify_managers_cache.clear()
 
-    ticket_link = _ticket_url(ticket)
-    subject = f"[Ticket #{ticket.id}] {ticket.subject or 'Ticket'} – {event_summary}"
+
+for _event_name in ("after_insert", "after_update", "after_delete"):
+    event.listen(User, _event_name, _invalidate_notify_managers)
+
+
+def _build_email_body(ticket, actor, department, event_summary, details, ticket_link):
     body_lines = [
         f"Ticket #{ticket.id}: {ticket.subject or 'No subject'}",
         f"Event: {event_summary}",
@@ -142,44 +395,50 @@ def _notify_team_managers(ticket, actor, event_summary, details=None):
         body_lines.append(details)
     body_lines.append("")
     body_lines.append(f"View ticket: {ticket_link}")
-    body = "\n".join(body_lines)
-
-    teams_text = (
-        f"**{subject}**\n\n"
-        f"Ticket #{ticket.id}: {ticket.subject or 'No subject'}\n"
-        f"Event: {event_summary}\n"
-        f"Actor: {actor.display_name} ({actor.username})\n"
-        f"Department: {department}\n"
-        f"Status: {ticket.status or 'Unknown'} | Priority: {ticket.priority or 'Unspecified'}\n"
-    )
-    if details:
-        teams_text += f"\n{details}\n"
-    teams_text += f"\n[View ticket]({ticket_link})"
+    return "\n".join(body_lines)
+
 
+def _build_teams_payload(ticket, actor, department, subject, event_summary, details, ticket_link):
     actor_line = f"{actor.display_name} ({actor.username})"
-    teams_facts = [
-        {"name": "Ticket", "value": f"#{ticket.id}: {ticket.subject or 'No subject'}"},
-        {"name": "Department", "value": department},
-        {"name": "Status", "value": ticket.status or 'Unknown'},
-        {"name": "Priority", "value": ticket.priority or 'Unspecified'},
+    text_lines = [
+        f"**{subject}**",
+        "",
+        f"Ticket #{ticket.id}: {ticket.subject or 'No subject'}",
+        f"Event: {event_summary}",
+        f"Actor: {actor_line}",
+        f"Department: {department}",
+        f"Status: {ticket.status or 'Unknown'} | Priority: {ticket.priority or 'Unspecified'}",
+        "",
     ]
-    teams_payload = {
+    if details:
+        text_lines.extend((details, ""))
+    text_lines.append(f"[View ticket]({ticket_link})")
+
+    section = {
+        "activityTitle": actor_line,
+        "activitySubtitle": event_summary,
+        "facts": [
+            {"name": "Ticket", "value": f"#{ticket.id}: {ticket.subject or 'No subject'}"},
+            {"name": "Department", "value": department},
+            {"name": "Status", "value": ticket.status or 'Unknown'},
+            {"name": "Priority", "value": ticket.priority or 'Unspecified'},
+        ],
+        "markdown": True,
+    }
+    activity_image = actor.avatar_url(64) if hasattr(actor, "avatar_url") else None
+    if activity_image:
+        section["activityImage"] = activity_image
+    if details:
+        section["text"] = details
+
+    return {
         "@type": "MessageCard",
         "@context": "https://schema.org/extensions",
-        "summary": subject,
+        "summary": actor.display_name,
         "themeColor": "4B5FC1",
         "title": subject,
-        "text": teams_text,
-        "sections": [
-            {
-                "activityTitle": actor_line,
-                "activityImage": actor.avatar_url(64) if hasattr(actor, "avatar_url") else None,
-                "activitySubtitle": event_summary,
-                "facts": teams_facts,
-                "markdown": True,
-                **({"text": details} if details else {}),
-            }
-        ],
+        "text": "\n".join(text_lines),
+        "sections": [section],
         "potentialAction": [
             {
                 "@type": "OpenUri",
@@ -193,53 +452,63 @@ def _notify_team_managers(ticket, actor, event_summary, details=None):
             }
         ],
     }
-    if not teams_payload["sections"][0]["activityImage"]:
-        teams_payload["sections"][0].pop("activityImage")
-    teams_payload["summary"] = actor.display_name
+
+
+def _notify_team_managers(ticket, actor, event_summary, details=None):
+    """
+    Notify managers in the actor's department when a team member updates a ticket.
+    """
+
+    if not current_app.config.get("TICKET_NOTIFY_ENABLED", True):
+        return
+    notify_roles = current_app.config.get("TICKET_NOTIFY_ROLES") or _DEFAULT_NOTIFY_ROLES
+    if not actor or actor.role not in notify_roles:
+        return
+    department = (actor.department or "").strip()
+    if not department:
+        return
+
+    managers = _get_notify_managers(department.lower())
+    if not managers:
+        return
 
     mail_sender = current_app.config.get("MAIL_DEFAULT_SENDER") or current_app.config.get("MAIL_USERNAME")
-    warned_mail = False
-
-    for manager in managers:
-        manager_email = (manager.email or "").strip() if manager.email else None
-        manager_username = manager.username
-        teams_webhook = manager.teams_webhook_url
-
-        if manager.notify_team_ticket_email:
-            if mail_sender and manager_email:
-                message = Message(subject=subject, recipients=[manager_email], body=body, sender=mail_sender)
-                queue_mail_with_optional_auth(
-                    message,
-                    description=f"ticket notification email to {manager_email}",
-                )
-            elif not mail_sender and not warned_mail:
-                current_app.logger.warning("MAIL_DEFAULT_SENDER is not configured; skipping ticket notification emails.")
-                warned_mail = True
-
-        if manager.notify_team_ticket_teams and teams_webhook:
-            payload = copy.deepcopy(teams_payload)
-
-            def _send_teams_notification(
-                webhook_url=teams_webhook,
-                username=manager_username,
-                data=payload,
-            ):
-                try:
-                    response = requests.post(webhook_url, json=data, timeout=6)
-                    if response.status_code >= 400:
-                        current_app.logger.warning(
-                            "Teams webhook for manager %s returned status %s", username, response.status_code
-                        )
-                except requests.RequestException:
-                    current_app.logger.exception(
-                        "Failed to send Teams ticket notification for manager %s", username
-                    )
-
-            submit_background_task(
-                _send_teams_notification,
-                description=f"Teams ticket notification for manager {manager_username}",
+    email_recipients = [
+        (m.email or "").strip()
+        for m in managers
+        if m.notify_team_ticket_email and (m.email or "").strip()
+    ]
+    teams_recipients = [
+        (m.username, m.teams_webhook_url)
+        for m in managers
+        if m.notify_team_ticket_teams and m.teams_webhook_url
+    ]
+    if not mail_sender and any(m.notify_team_ticket_email for m in managers):
+        current_app.logger.warning("MAIL_DEFAULT_SENDER is not configured; skipping ticket notification emails.")
+        email_recipients = []
+    if not email_recipients and not teams_recipients:
+        return
+
+    ticket_link = _ticket_url(ticket)
+    subject = f"[Ticket #{ticket.id}] {ticket.subject or 'Ticket'} – {event_summary}"
+
+    if email_recipients:
+        body = _build_email_body(ticket, actor, department, event_summary, details, ticket_link)
+        for manager_email in email_recipients:
+            message = Message(subject=subject, recipients=[manager_email], body=body, sender=mail_sender)
+            queue_mail_with_optional_auth(
+                message,
+                description=f"ticket notification email to {manager_email}",
             )
 
+    if teams_recipients:
+        teams_payload = _build_teams_payload(
+            ticket, actor, department, subject, event_summary, details, ticket_link
+        )
+        app = current_app._get_current_object()
+        for username, webhook_url in teams_recipients:
+            queue_teams_notification(app, username, webhook_url, teams_payload)
+
 
 # ============================================================
 # LIST
@@ -248,45 +517,91 @@ def _notify_team_managers(ticket, actor, event_summary, details=None):
 @login_required
 def list_tickets():
     """Admin sees all, Manager sees department + own, User sees own."""
+    user = current_user._get_current_object()
+    role = user.role
+    uid = user.id
+    dept = user.department
+    page = max(request.args.get("page", 1, type=int) or 1, 1)
+    per_page = TICKETS_PER_PAGE
+    search = (request.args.get("q") or "").strip()
+    status_filter = (request.args.get("status") or "").strip()
     try:
-        if current_user.role == "admin":
-            tickets = Ticket.query.order_by(Ticket.id.desc()).all()
+        if role == "admin":
+            query = Ticket.query
             users = User.query.filter_by(
                 active=True).order_by(User.username).all()
 
-        elif current_user.role == "manager":
+        elif role == "manager":
             dept_users = User.query.filter_by(
-                department=current_user.department
+                department=dept
             ).with_entities(User.id).subquery()
 
-            tickets = Ticket.query.filter(
+            query = Ticket.query.filter(
                 or_(
-                    Ticket.created_by == current_user.id,
-                    Ticket.assigned_to == current_user.id,
+                    Ticket.created_by == uid,
+                    Ticket.assigned_to == uid,
                     Ticket.created_by.in_(dept_users),
                     Ticket.assigned_to.in_(dept_users)
                 )
-            ).order_by(Ticket.id.desc()).all()
+            )
 
             allowed_roles = ["technician", "user"]
             users = User.query.filter(
                 User.active.is_(True),
-                User.department == current_user.department,
+                User.department == dept,
                 User.role.in_(allowed_roles),
             ).order_by(User.username).all()
 
-            if current_user.active and not any(u.id == current_user.id for u in users):
-                users.append(current_user)
+            if user.active and not any(u.id == uid for u in users):
+                users.append(user)
                 users.sort(key=lambda u: (u.username or "").lower())
 
         else:
-            tickets = Ticket.query.filter(
-                or_(Ticket.created_by == current_user.id,
-                    Ticket.assigned_to == current_user.id)
-            ).order_by(Ticket.id.desc()).all()
+            query = Ticket.query.filter(
+                or_(Ticket.created_by == uid,
+                    Ticket.assigned_to == uid)
+            )
             users = []
 
-        return render_template("tickets/list.html", tickets=tickets, users=users)
+        if search:
+            like_term = f"%{search}%"
+            conditions = [Ticket.subject.ilike(like_term), Ticket.description.ilike(like_term)]
+            if search.isdigit():
+                conditions.append(Ticket.id == int(search))
+            query = query.filter(or_(*conditions))
+
+        status_counts = dict(
+            query.with_entities(Ticket.status, func.count(Ticket.id)).group_by(Ticket.status).all()
+        )
+        if status_filter:
+            query = query.filter(Ticket.status == status_filter)
+        page_query = query.options(
+            load_only(*_TICKET_LIST_COLUMNS),
+            joinedload(Ticket.creator).load_only(User.id, User.username),
+            joinedload(Ticket.assignee).load_only(User.id, User.username),
+            selectinload(Ticket.comments).load_only(TicketComment.id, TicketComment.ticket_id),
+            selectinload(Ticket.attachments).load_only(Attachment.id, Attachment.ticket_id),
+        ).order_by(Ticket.id.desc())
+        pagination = page_query.paginate(
+            page=page, per_page=per_page, error_out=False, count=False
+        )
+        # The per-status counts already cover every ticket matching the search.
+        if status_filter:
+            pagination.total = status_counts.get(status_filter, 0)
+        else:
+            pagination.total = sum(status_counts.values())
+        pagination_args = {k: v for k, v in request.args.items() if k != "page" and v}
+
+        return render_template(
+            "tickets/list.html",
+            tickets=pagination.items,
+            users=users,
+            pagination=pagination,
+            pagination_args=pagination_args,
+            status_counts=status_counts,
+            search=search,
+            status_filter=status_filter,
+        )
     except Exception as e:
         flash(f"Error loading tickets: {str(e)}", "danger")
         return redirect(url_for("dashboard.index"))
@@ -298,6 +613,9 @@ def list_tickets():
 @tickets_bp.route("/tickets/add", methods=["POST"])
 @login_required
 def create_ticket():
+    user = current_user._get_current_object()
+    uid = user.id
+    dept = user.department
     try:
         subject = request.form.get("subject")
         description = request.form.get("description")
@@ -314,22 +632,22 @@ def create_ticket():
             description=description,
             priority=request.form.get("priority"),
             status="Open",
-            created_by=current_user.id,
-            department=current_user.department
+            created_by=uid,
+            department=dept
         )
         db.session.add(t)
-        db.session.commit()
+        db.session.flush()
 
         db.session.add(AuditLog(
             action="Create Ticket",
-            username=current_user.username,
+            username=user.username,
             ticket_id=t.id
         ))
         db.session.commit()
 
         _notify_team_managers(
             t,
-            current_user,
+            user,
             "created a ticket",
             f"Priority: {t.priority or 'Unspecified'} | Status: {t.status or 'Open'}",
         )
@@ -357,21 +675,25 @@ def create_ticket():
 @login_required
 def edit_ticket(id):
     """Manager can assign only within department; Admin to all."""
+    user = current_user._get_current_object()
+    role = user.role
+    uid = user.id
+    dept = user.department
     ticket = Ticket.query.get_or_404(id)
     old_status = ticket.status
 
     try:
-        if current_user.role == "admin":
+        if role == "admin":
             users = User.query.filter_by(active=True).order_by(User.username).all()
-        elif current_user.role == "manager":
+        elif role == "manager":
             allowed_roles = ["technician", "user"]
             users = User.query.filter(
                 User.active.is_(True),
-                User.department == current_user.department,
+                User.department == dept,
                 User.role.in_(allowed_roles),
             ).order_by(User.username).all()
-            if current_user.active and not any(u.id == current_user.id for u in users):
-                users.append(current_user)
+            if user.active and not any(u.id == uid for u in users):
+                users.append(user)
                 users.sort(key=lambda u: (u.username or "").lower())
         else:
             users = []
@@ -391,14 +713,14 @@ def edit_ticket(id):
             ticket.status = request.form.get("status", ticket.status)
             assigned_to_val = request.form.get("assigned_to")
 
-            if current_user.role == "manager" and assigned_to_val:
+            if role == "manager" and assigned_to_val:
                 assigned_user = User.query.get(int(assigned_to_val))
                 if not assigned_user:
                     msg = "Selected user was not found."
                     return jsonify(success=False, message=msg, category="danger")
-                if assigned_user.id != current_user.id:
+                if assigned_user.id != uid:
                     allowed_roles = {"technician", "user"}
-                    if assigned_user.department != current_user.department:
+                    if assigned_user.department != dept:
                         msg = "Managers can assign only to members of their team."
                         return jsonify(success=False, message=msg, category="danger")
                     if assigned_user.role not in allowed_roles:
@@ -409,7 +731,7 @@ def edit_ticket(id):
                     # Always return JSON for modal consistency
                     return jsonify(success=False, message=msg, category="danger")
 
-            if current_user.role in ["admin", "manager"]:
+            if role in ["admin", "manager"]:
                 ticket.assigned_to = int(
                     assigned_to_val) if assigned_to_val and assigned_to_val.isdigit() else None
 
@@ -419,7 +741,7 @@ def edit_ticket(id):
                 ticket.closed_at = None
 
             db.session.add(AuditLog(action="Edit Ticket",
-                           username=current_user.username, ticket_id=ticket.id))
+                           username=user.username, ticket_id=ticket.id))
             db.session.commit()
 
             changes = []
@@ -438,18 +760,24 @@ def edit_ticket(id):
             if ticket.assigned_to != original_state["assigned_to"]:
                 old_assignee = None
                 new_assignee = None
+                ids_to_resolve = {i for i in (original_state["assigned_to"], ticket.assigned_to) if i}
+                resolved = (
+                    {u.id: u for u in User.query.filter(User.id.in_(ids_to_resolve)).all()}
+                    if ids_to_resolve
+                    else {}
+                )
                 if original_state["assigned_to"]:
-                    old_user = User.query.get(original_state["assigned_to"])
+                    old_user = resolved.get(original_state["assigned_to"])
                     old_assignee = old_user.display_name if old_user else f"User {original_state['assigned_to']}"
                 if ticket.assigned_to:
-                    new_user = User.query.get(ticket.assigned_to)
+                    new_user = resolved.get(ticket.assigned_to)
                     new_assignee = new_user.display_name if new_user else f"User {ticket.assigned_to}"
                 changes.append(
                     f"Assignee: {old_assignee or 'Unassigned'} → {new_assignee or 'Unassigned'}"
                 )
 
             details = "\n".join(changes) if changes else "Ticket details were updated."
-            _notify_team_managers(ticket, current_user, "updated a ticket", details)
+            _notify_team_managers(ticket, user, "updated a ticket", details)
 
             return jsonify(success=True, message=f"Ticket #{ticket.id} updated successfully.", category="success")
 
@@ -459,77 +787,78 @@ def edit_ticket(id):
             return render_template("tickets/edit.html", ticket=ticket, users=users)
         
         # For regular requests (fallback)
-        class DummyForm:
-            def __init__(self, t):
-                self.subject = type('F', (), {'data': t.subject})()
-                self.description = type('F', (), {'data': t.description})()
-                self.priority = type('F', (), {'data': t.priority})()
-                self.status = type('F', (), {'data': t.status})()
-                self.department = type('F', (), {'data': t.department})()
-                self.assigned_to = type('F', (), {'data': t.assigned_to})()
-
-        form = DummyForm(ticket)
+        form = _dummy_form(ticket)
         return render_template("tickets/edit.html", form=form, users=users, mode="edit", ticket=ticket)
 
     except Exception as e:
         db.session.rollback()
         return jsonify(success=False, message=f"Error editing ticket: {str(e)}", category="danger")
 
+def _ticket_activity_rows(ticket_id):
+    """
+    Fetch a ticket's comments, attachments and audit logs in one UNION ALL round trip.
+
+    Returns comment, attachment and log view tuples with raw UTC timestamps.
+    Comments come back oldest first; attachments and logs newest first, as the
+    ticket views show them.
+    """
+    no_value = literal(None, String)
+    statement = union_all(
+        select(
+            literal("comment").label("kind"),
+            TicketComment.created_at.label("ts"),
+            TicketComment.user.label("a"),
+            TicketComment.comment.label("b"),
+            no_value.label("c"),
+        ).where(TicketComment.ticket_id == ticket_id),
+        select(
+            literal("attachment"),
+            Attachment.uploaded_at,
+            Attachment.filename,
+            Attachment.filepath,
+            Attachment.uploaded_by,
+        ).where(Attachment.ticket_id == ticket_id),
+        select(
+            literal("log"),
+            AuditLog.timestamp,
+            AuditLog.action,
+            AuditLog.username,
+            no_value,
+        ).where(AuditLog.ticket_id == ticket_id),
+    )
+    comments, attachments, logs = [], [], []
+    for kind, ts, a, b, c in db.session.execute(statement):
+        if kind == "comment":
+            comments.append(_CommentView(ts, a, b))
+        elif kind == "attachment":
+            attachments.append(_AttachmentView(ts, a, b, c))
+        else:
+            logs.append(_LogView(ts, a, b))
+
+    # Same NULL placement as the database: last ascending, first descending.
+    def _ts_key(row):
+        return (row[0] is None, row[0] or datetime.min)
+
+    comments.sort(key=_ts_key)
+    attachments.sort(key=_ts_key, reverse=True)
+    logs.sort(key=_ts_key, reverse=True)
+    return comments, attachments, logs
+
+
 # ============================================================
 # VIEW
 # ============================================================
 @tickets_bp.route("/tickets/<int:id>/view", methods=["GET"])
 @login_required
 def view_ticket(id):
-    t = Ticket.query.get_or_404(id)
+    t = _authorized_ticket(id)
 
     try:
-        allowed = False
-        if current_user.role == "admin":
-            allowed = True
-        elif current_user.role == "manager":
-            dept_user_ids = {u.id for u in User.query.filter_by(
-                department=current_user.department).all()}
-            if (
-                t.created_by == current_user.id
-                or t.assigned_to == current_user.id
-                or (t.created_by in dept_user_ids)
-                or (t.assigned_to in dept_user_ids)
-            ):
-                allowed = True
-        else:
-            if t.created_by == current_user.id or t.assigned_to == current_user.id:
-                allowed = True
-
-        if not allowed:
+        if t is None:
             flash("You are not authorized to view this ticket.", "danger")
             abort(403)
 
-        comments = TicketComment.query.filter_by(
-            ticket_id=id).order_by(TicketComment.created_at.asc()).all()
-        attachments = Attachment.query.filter_by(
-            ticket_id=id).order_by(Attachment.uploaded_at.desc()).all()
-        logs = AuditLog.query.filter_by(ticket_id=id).order_by(
-            AuditLog.timestamp.desc()).all()
-
-        comments_data = [{
-            "user": c.user,
-            "comment": c.comment,
-            "created_at_local": to_local(c.created_at)
-        } for c in comments]
-
-        attachments_data = [{
-            "filename": a.filename,
-            "filepath": a.filepath,
-            "uploaded_by": a.uploaded_by,
-            "uploaded_at_local": to_local(a.uploaded_at)
-        } for a in attachments]
-
-        logs_data = [{
-            "action": l.action,
-            "username": l.username,
-            "timestamp_local": to_local(l.timestamp)
-        } for l in logs]
+        comments, attachments, logs = _ticket_activity_rows(id)
 
         is_modal_request = request.headers.get("X-Requested-With") == "XMLHttpRequest" or request.args.get("modal")
         template_name = "tickets/view.html" if is_modal_request else "tickets/view_page.html"
@@ -537,9 +866,9 @@ def view_ticket(id):
         return render_template(
             template_name,
             ticket=t,
-            comments=comments_data,
-            attachments=attachments_data,
-            logs=logs_data,
+            comments=comments,
+            attachments=attachments,
+            logs=logs,
         )
     except Exception as e:
         flash(f"Error viewing ticket: {str(e)}", "danger")
@@ -552,42 +881,26 @@ def view_ticket(id):
 @tickets_bp.route("/tickets/<int:id>/comment", methods=["POST"])
 @login_required
 def add_comment(id):
-    t = Ticket.query.get_or_404(id)
+    user = current_user._get_current_object()
+    t = _authorized_ticket(id)
     text = request.form.get("comment")
     if not text:
         flash("Cannot add an empty comment.", "warning")
         return jsonify(error="Empty comment"), 400
 
     try:
-        allowed = False
-        if current_user.role == "admin":
-            allowed = True
-        elif current_user.role == "manager":
-            dept_user_ids = {u.id for u in User.query.filter_by(
-                department=current_user.department).all()}
-            if (
-                t.created_by == current_user.id
-                or t.assigned_to == current_user.id
-                or (t.created_by in dept_user_ids)
-                or (t.assigned_to in dept_user_ids)
-            ):
-                allowed = True
-        else:
-            if t.created_by == current_user.id or t.assigned_to == current_user.id:
-                allowed = True
-
-        if not allowed:
+        if t is None:
             flash("Not authorized to comment on this ticket.", "danger")
             abort(403)
 
         c = TicketComment(
-            ticket_id=id, user=current_user.username, comment=text)
+            ticket_id=id, user=user.username, comment=text)
         db.session.add(c)
         db.session.add(AuditLog(action="Add Comment",
-                                username=current_user.username, ticket_id=id))
+                                username=user.username, ticket_id=id))
         db.session.commit()
 
-        _notify_team_managers(t, current_user, "commented on a ticket", f"Comment: {_shorten(text, 240)}")
+        _notify_team_managers(t, user, "commented on a ticket", f"Comment: {_shorten(text, 240)}")
 
         flash("Comment added successfully.", "success")
         return jsonify(success=True)
@@ -602,27 +915,15 @@ def add_comment(id):
 @tickets_bp.route("/tickets/<int:id>/upload", methods=["POST"])
 @login_required
 def upload_file(id):
-    t = Ticket.query.get_or_404(id)
+    user = current_user._get_current_object()
+    t = _authorized_ticket(id)
     f = request.files.get("file")
     if not f or f.filename == "":
         flash("No file selected for upload.", "warning")
         return jsonify(error="No file"), 400
 
     try:
-        dept_user_ids = {u.id for u in User.query.filter_by(
-            department=current_user.department).all()}
-        allowed = (
-            current_user.role == "admin"
-            or (current_user.role == "manager" and (
-                t.created_by == current_user.id
-                or t.assigned_to == current_user.id
-                or (t.created_by in dept_user_ids)
-                or (t.assigned_to in dept_user_ids)
-            ))
-            or (t.created_by == current_user.id or t.assigned_to == current_user.id)
-        )
-
-        if not allowed:
+        if t is None:
             flash("You are not authorized to upload to this ticket.", "danger")
             abort(403)
 
@@ -646,7 +947,7 @@ def upload_file(id):
         stored_name = f"{unique_prefix}_{safe_name}"
 
         stored_path = os.path.join(upload_folder, stored_name)
-        f.save(stored_path)
+        _write_upload(f, stored_path)
 
         # Public web path is now a protected route
         web_path = f"/tickets/attachments/{stored_name}"
@@ -657,14 +958,14 @@ def upload_file(id):
             ticket_id=id,
             filename=display_name,
             filepath=web_path,
-            uploaded_by=current_user.username,
+            uploaded_by=user.username,
         )
         db.session.add(a)
         db.session.add(AuditLog(action="Upload File",
-                                username=current_user.username, ticket_id=id))
+                                username=user.username, ticket_id=id))
         db.session.commit()
 
-        _notify_team_managers(t, current_user, "added an attachment", f"Attachment: {display_name}")
+        _notify_team_managers(t, user, "added an attachment", f"Attachment: {display_name}")
 
         flash(f"File '{display_name}' uploaded successfully.", "success")
         return jsonify(success=True)
@@ -680,41 +981,40 @@ def upload_file(id):
 @login_required
 def delete_ticket(id):
     try:
-        t = Ticket.query.get_or_404(id)
+        subject = db.session.query(Ticket.subject).filter(Ticket.id == id).first_or_404().subject
+        attachment_paths = db.session.scalars(
+            select(Attachment.filepath).where(Attachment.ticket_id == id)
+        ).all()
         # Remove attachment files from disk before deleting DB records
         try:
             upload_folder = _ensure_ticket_upload_folder()
-            static_upload_dir = os.path.join(
-                os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")),
-                "static",
-                "uploads",
-            )
-            for a in list(t.attachments or []):
-                path_val = a.filepath or ""
-                # Instance-stored files (new behavior)
-                stored_name = os.path.basename(path_val)
-                if path_val.startswith("/tickets/attachments/") and stored_name:
-                    file_path = os.path.join(upload_folder, stored_name)
-                    if os.path.exists(file_path):
-                        try:
-                            os.remove(file_path)
-                        except OSError:
-                            pass
-                # Legacy static files cleanup (best-effort)
-                elif path_val.startswith("/static/uploads/"):
-                    legacy_name = os.path.basename(path_val)
-                    legacy_path = os.path.join(static_upload_dir, legacy_name)
-                    if os.path.exists(legacy_path):
-                        try:
-                            os.remove(legacy_path)
-                        except OSError:
-                            pass
+            names_by_kind = {"instance": [], "static": []}
+            for path_val in attachment_paths:
+                path_val = path_val or ""
+                name = os.path.basename(path_val)
+                kind = _attachment_kind(path_val)
+                if name and kind:
+                    names_by_kind[kind].append(name)
+            _unlink_in_dir(upload_folder, names_by_kind["instance"])
+            # Legacy static files cleanup (best-effort)
+            _unlink_in_dir(STATIC_UPLOAD_DIR, names_by_kind["static"])
         except Exception:
             # Continue with DB deletion even if file cleanup fails
             pass
-        db.session.delete(t)
-        db.session.add(AuditLog(action="Delete Ticket",
-                                username=current_user.username, ticket_id=id))
+        # Not linked to the ticket, so the entry outlives it; the id and subject go in the text.
+        db.session.add(AuditLog(
+            action=f"Delete Ticket #{id}: {subject or ''}"[:100],
+            username=current_user.username,
+            ticket_id=None,
+        ))
+        # One statement per child table, unless the live schema cascades the ticket delete.
+        schema_actions = fk_actions(db.session.get_bind())
+        for child in (Attachment, TicketComment, AuditLog):
+            if (child.__tablename__, "ticket_id", "CASCADE") not in schema_actions:
+                db.session.execute(delete(child).where(child.ticket_id == id))
+        db.session.execute(
+            delete(Ticket).where(Ticket.id == id).execution_options(synchronize_session=False)
+        )
         db.session.commit()
 
         flash(f"Ticket #{id} deleted successfully.", "danger")
@@ -738,36 +1038,22 @@ def delete_ticket(id):
 def download_ticket_attachment(filename):
     # Find attachment by its web path suffix
     path_value = f"/tickets/attachments/{filename}"
-    attachment = Attachment.query.filter(Attachment.filepath == path_value).first_or_404()
-    ticket = Ticket.query.get_or_404(attachment.ticket_id)
-
-    # Authorization similar to viewing a ticket
-    allowed = False
-    if current_user.role == "admin":
-        allowed = True
-    elif current_user.role == "manager":
-        dept_user_ids = {u.id for u in User.query.filter_by(department=current_user.department).all()}
-        if (
-            ticket.created_by == current_user.id
-            or ticket.assigned_to == current_user.id
-            or (ticket.created_by in dept_user_ids)
-            or (ticket.assigned_to in dept_user_ids)
-        ):
-            allowed = True
-    else:
-        if ticket.created_by == current_user.id or ticket.assigned_to == current_user.id:
-            allowed = True
+    attachment = (
+        db.session.query(Attachment.ticket_id, Attachment.filename)
+        .filter(Attachment.filepath == path_value)
+        .first_or_404()
+    )
 
-    if not allowed:
+    # Same predicate as viewing the ticket
+    if not _can_access_ticket(attachment.ticket_id):
         flash("You are not authorized to access this attachment.", "danger")
         abort(403)
 
     upload_folder = _ensure_ticket_upload_folder()
-    return send_from_directory(
+    return _send_ticket_upload(
         upload_folder,
         filename,
-        as_attachment=True,
-        download_name=(attachment.filename or os.path.basename(filename)),
+        attachment.filename or os.path.basename(filename),
     )
 
 
@@ -777,7 +1063,22 @@ def download_ticket_attachment(filename):
 @tickets_bp.route("/tickets/<int:ticket_id>/archive", methods=["POST"])
 @login_required
 def archive_ticket(ticket_id: int):
-    ticket = Ticket.query.get_or_404(ticket_id)
+    # Lock the row so concurrent archive requests don't both snapshot it. A
+    # request that finds it locked backs off instead of waiting; the lock may
+    # be held by any writer (an edit, a comment), not only another archive.
+    ticket = (
+        Ticket.query.filter(Ticket.id == ticket_id)
+        .with_for_update(skip_locked=True)
+        .one_or_none()
+    )
+    if ticket is None:
+        if db.session.query(Ticket.id).filter(Ticket.id == ticket_id).first() is None:
+            abort(404)
+        msg = _("This ticket is being updated by another request. Please try again in a moment.")
+        if request.headers.get("X-Requested-With") == "XMLHttpRequest":
+            return jsonify(success=False, message=msg), 409
+        flash(msg, "info")
+        return redirect(request.referrer or url_for("tickets.list_tickets"))
     if not _user_can_archive_ticket(ticket):
         flash(_("You are not authorized to archive this ticket."), "danger")
         abort(403)
@@ -809,27 +1110,27 @@ def archive_ticket(ticket_id: int):
 @tickets_bp.route("/tickets/archives")
 @login_required
 def list_ticket_archives():
+    user = current_user._get_current_object()
+    role = user.role
+    uid = user.id
+    dept = user.department
     query = TicketArchive.query
-    if current_user.role == "admin":
+    if role == "admin":
         pass
-    elif current_user.role == "manager":
-        dept_subq = (
-            User.query.filter_by(department=current_user.department)
-            .with_entities(User.id)
-            .subquery()
-        )
-        query = query.filter(
-            or_(
-                TicketArchive.created_by.in_(dept_subq),
-                TicketArchive.assigned_to.in_(dept_subq),
-            )
+    elif role == "manager":
+        creator = aliased(User)
+        assignee = aliased(User)
+        query = (
+            query.outerjoin(creator, creator.id == TicketArchive.created_by)
+            .outerjoin(assignee, assignee.id == TicketArchive.assigned_to)
+            .filter(or_(creator.department == dept, assignee.department == dept))
         )
     else:
         query = query.filter(
             or_(
-                TicketArchive.created_by == current_user.id,
-                TicketArchive.assigned_to == current_user.id,
-                TicketArchive.archived_by == current_user.id,
+                TicketArchive.created_by == uid,
+                TicketArchive.assigned_to == uid,
+                TicketArchive.archived_by == uid,
             )
         )
     archives = query.order_by(TicketArchive.archived_at.desc()).all()
@@ -867,36 +1168,27 @@ def download_archived_attachment(archive_id: int, attachment_index: int):
         return _archive_detail_redirect(source, archive)
 
     upload_folder = _ensure_ticket_upload_folder()
-    static_upload_dir = os.path.join(
-        os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")),
-        "static",
-        "uploads",
-    )
 
     candidate_paths = []
-    if path_value.startswith("/tickets/attachments/"):
-        stored_name = os.path.basename(path_value)
-        if stored_name:
-            candidate_paths.append(("instance", upload_folder, stored_name))
-    elif path_value.startswith("/static/uploads/"):
-        stored_name = os.path.basename(path_value)
-        if stored_name:
-            candidate_paths.append(("static", static_upload_dir, stored_name))
-    else:
-        if os.path.isabs(path_value):
-            candidate_paths.append(("absolute", None, path_value))
-        stored_name = os.path.basename(path_value)
-        if stored_name:
-            candidate_paths.append(("instance", upload_folder, stored_name))
-
+    stored_name = os.path.basename(path_value)
+    kind = _attachment_kind(path_value)
+    if kind is None and os.path.isabs(path_value):
+        candidate_paths.append(("absolute", None, path_value))
+    if stored_name:
+        directory = STATIC_UPLOAD_DIR if kind == "static" else upload_folder
+        candidate_paths.append((kind or "instance", directory, stored_name))
+
+    # Each sender stats the file itself, so a missing candidate surfaces as
+    # NotFound/FileNotFoundError instead of needing a separate exists() probe.
     for path_kind, directory, value in candidate_paths:
-        if path_kind == "absolute":
-            if os.path.exists(value):
+        try:
+            if path_kind == "absolute":
                 return send_file(value, as_attachment=True, download_name=download_label)
-            continue
-        full_path = os.path.join(directory, value)
-        if os.path.exists(full_path):
+            if path_kind == "instance":
+                return _send_ticket_upload(directory, value, download_label)
             return send_from_directory(directory, value, as_attachment=True, download_name=download_label)
+        except (NotFound, FileNotFoundError):
+            continue
 
     flash(_("Attachment file could not be located on the server."), "warning")
     return _archive_detail_redirect(source, archive)
@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+"""
+Coalescing background dispatcher for Microsoft Teams ticket notifications.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+TEAMS_WEBHOOK_TIMEOUT = 6
+TEAMS_FANOUT_WORKERS = 8
+TEAMS_QUEUE_MAXSIZE = 1000
+TEAMS_BATCH_MAX_ITEMS = 64
+TEAMS_BATCH_MAX_WAIT_SECONDS = 0.2
+
+# Shared session so Teams webhook posts reuse pooled keep-alive connections
+# instead of paying a fresh TCP+TLS handshake per manager.
+_TEAMS_SESSION = requests.Session()
+_TEAMS_SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32))
+
+_dispatcher_lock = threading.Lock()
+_dispatcher: Optional["TeamsDispatcher"] = None
+
+TeamsItem = Tuple[str, str, Dict[str, Any]]
+
+
+def init_app(app) -> None:
+    """Start the dispatcher thread when the Flask app boots."""
+    if app.config.get("TESTING"):
+        return
+    # Avoid double-start in debug reloader
+    if app.debug and os.environ.get("WERKZEUG_RUN_MAIN") != "true":
+        return
+    ensure_dispatcher_running(app)
+
+
+def ensure_dispatcher_running(app) -> "TeamsDispatcher":
+    """Return the process-wide dispatcher, (re)starting its thread if needed."""
+    global _dispatcher
+    with _dispatcher_lock:
+        if _dispatcher is None:
+            _dispatcher = TeamsDispatcher(app)
+        _dispatcher.start()
+        return _dispatcher
+
+
+def queue_teams_notification(app, username: str, webhook_url: str, payload: Dict[str, Any]) -> None:
+    """Queue one Teams webhook post; it is sent with the next dispatcher batch."""
+    ensure_dispatcher_running(app).push(username, webhook_url, payload)
+
+
+class TeamsDispatcher:
+    """
+    Single worker thread draining queued Teams posts in short batches.
+
+    Each batch collects up to ``TEAMS_BATCH_MAX_ITEMS`` posts or waits at most
+    ``TEAMS_BATCH_MAX_WAIT_SECONDS`` after the first one. Identical
+    webhook/payload pairs within a batch are posted once.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self._queue: "queue.Queue[TeamsItem]" = queue.Queue(maxsize=TEAMS_QUEUE_MAXSIZE)
+        self._thread: Optional[threading.Thread] = None
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        # A forked worker inherits neither the thread nor the pool's threads.
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+        self._pool = ThreadPoolExecutor(
+            max_workers=TEAMS_FANOUT_WORKERS,
+            thread_name_prefix="helpdesk-teams",
+        )
+        self._thread = threading.Thread(target=self._run, name="TeamsDispatcher", daemon=True)
+        self._thread.start()
+
+    def push(self, username: str, webhook_url: str, payload: Dict[str, Any]) -> None:
+        try:
+            self._queue.put_nowait((username, webhook_url, payload))
+        except queue.Full:
+            self.app.logger.warning(
+                "Teams notification queue is full; dropping notification for manager %s", username
+            )
+
+    def _run(self) -> None:
+        while True:
+            batch = self._drain()
+            try:
+                self._flush(batch)
+            except Exception:
+                self.app.logger.exception("Teams dispatcher failed to flush %s notification(s)", len(batch))
+
+    def _drain(self) -> List[TeamsItem]:
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + TEAMS_BATCH_MAX_WAIT_SECONDS
+        while len(batch) < TEAMS_BATCH_MAX_ITEMS:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _flush(self, batch: List[TeamsItem]) -> None:
+        seen = set()
+        unique: List[TeamsItem] = []
+        for item in batch:
+            _username, webhook_url, payload = item
+            key = (webhook_url, hash(json.dumps(payload, sort_keys=True, default=str)))
+            if key in seen:
+                continue
+            seen.add(key)
+            unique.append(item)
+
+        if len(unique) == 1:
+            self._post(unique[0])
+            return
+        list(self._pool.map(self._post, unique))
+
+    def _post(self, item: TeamsItem) -> None:
+        username, webhook_url, payload = item
+        try:
+            response = _TEAMS_SESSION.post(webhook_url, json=payload, timeout=TEAMS_WEBHOOK_TIMEOUT)
+            if response.status_code >= 400:
+                self.app.logger.warning(
+                    "Teams webhook for manager %s returned status %s", username, response.status_code
+                )
+        except requests.RequestException:
+            self.app.logger.exception("Failed to send Teams ticket notification for manager %s", username)
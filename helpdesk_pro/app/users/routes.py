@@ -1,7 +1,19 @@
+import csv
+import io
 import os
 import time
 import shutil
-from flask import Blueprint, render_template, request, jsonify, abort, current_app
+from functools import lru_cache
+from flask import (
+    Blueprint,
+    Response,
+    render_template,
+    request,
+    jsonify,
+    abort,
+    current_app,
+    stream_with_context,
+)
 from flask_login import login_required, current_user
 from app.utils.files import secure_filename
 from app import db, csrf
@@ -23,14 +35,46 @@ from app.models.collab import (
 )
 from app.models.assistant import AssistantSession, AssistantDocument
 from app.utils.roles import role_required
+from app.utils.schema import fk_actions
 from app.utils.security import validate_password_strength
-from sqlalchemy import func, or_, text, inspect
+from sqlalchemy import (
+    bindparam,
+    column as sa_column,
+    delete,
+    event,
+    exists,
+    func,
+    inspect,
+    null,
+    or_,
+    select,
+    table as sa_table,
+    update,
+)
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import raiseload
 
 users_bp = Blueprint("users", __name__)
 
 ALLOWED_AVATAR_EXTENSIONS = {"png", "jpg", "jpeg", "gif", "webp"}
 MAX_AVATAR_SIZE = 5 * 1024 * 1024  # 5MB
+# Avatar plus the profile's text fields and multipart framing.
+MAX_PROFILE_FORM_SIZE = MAX_AVATAR_SIZE + 64 * 1024
+_avatar_folders_ready = set()
+USERS_PER_PAGE = 100
+USERS_EXPORT_CHUNK = 1000
+_TRUTHY = frozenset({"1", "true", "on", "yes"})
+# Constraint names (PostgreSQL) and message fragments (SQLite) of the user unique keys.
+_USER_UNIQUE_MARKERS = (
+    "uq_user_username_ci",
+    "uq_user_email_ci",
+    "user_username_key",
+    "user_email_key",
+    "user.username",
+    "user.email",
+)
+_USER_STATS_TTL_SECONDS = 60
+_user_stats_cache = {}
 
 
 def _checkbox_enabled(form, name: str) -> bool:
@@ -44,25 +88,165 @@ def _checkbox_enabled(form, name: str) -> bool:
     value = values[-1]
     if isinstance(value, str):
         value = value.lower()
-    return value in {"1", "true", "on", "yes"}
+    return value in _TRUTHY
+
+
+# Built once; edit_user only binds parameters instead of rebuilding and re-keying the select.
+# Emails are stored lowercased, so they compare against the plain unique index.
+_EDIT_CONFLICT_STMT = select(func.lower(User.username), User.email).where(
+    or_(
+        func.lower(User.username) == bindparam("username_key"),
+        User.email == bindparam("email_key"),
+    ),
+    User.id != bindparam("user_id"),
+)
+
+
+def _is_duplicate_user_error(exc: IntegrityError) -> bool:
+    """True when `exc` comes from one of the username/email unique constraints."""
+    orig = getattr(exc, "orig", None)
+    constraint = getattr(getattr(orig, "diag", None), "constraint_name", None)
+    detail = constraint or str(orig)
+    return any(marker in detail for marker in _USER_UNIQUE_MARKERS)
+
+
+def _user_stats():
+    """
+    Return the totals shown above the user list.
+
+    Results are cached per process for ``_USER_STATS_TTL_SECONDS`` and
+    dropped whenever a User row changes.
+    """
+    now = time.time()
+    cached = _user_stats_cache.get("stats")
+    if cached and now - cached[0] < _USER_STATS_TTL_SECONDS:
+        return cached[1]
+
+    role_key = func.lower(User.role).label("role_key")
+    counts = db.session.execute(
+        select(role_key, User.active, func.count(User.id)).group_by(role_key, User.active)
+    ).all()
+    role_breakdown = {role: 0 for role in ['admin', 'manager', 'technician', 'user']}
+    total_users = 0
+    active_users = 0
+    for role, active, count in counts:
+        total_users += count
+        if active:
+            active_users += count
+        if role in role_breakdown:
+            role_breakdown[role] += count
+    stats = {
+        "total_users": total_users,
+        "active_users": active_users,
+        "inactive_users": total_users - active_users,
+        "role_breakdown": role_breakdown,
+    }
+    _user_stats_cache["stats"] = (now, stats)
+    return stats
+
+
+def _invalidate_user_stats(*_args):
+    _user_stats_cache.clear()
+
+
+for _event_name in ("after_insert", "after_update", "after_delete"):
+    event.listen(User, _event_name, _invalidate_user_stats)
 
 
 @users_bp.route("/users", methods=["GET"])
 @login_required
 @role_required('admin', 'manager')
 def list_users():
-    users = User.query.order_by(User.id.desc()).all()
-    total_users = len(users)
-    active_users = sum(1 for user in users if user.active)
-    inactive_users = total_users - active_users
-    role_breakdown = {role: sum(1 for user in users if (user.role or "").lower() == role) for role in ['admin', 'manager', 'technician', 'user']}
+    page = max(request.args.get("page", 1, type=int) or 1, 1)
+    search = (request.args.get("q") or "").strip()
+    role_filter = (request.args.get("role") or "").strip().lower()
+    stats = _user_stats()
+    total_users = stats["total_users"]
+
+    # users/list.html renders columns only; any relationship access is a bug.
+    query = User.query.options(raiseload("*"))
+    if search:
+        like_term = f"%{search}%"
+        conditions = [
+            User.username.ilike(like_term),
+            User.full_name.ilike(like_term),
+            User.email.ilike(like_term),
+            User.department.ilike(like_term),
+        ]
+        if search.isdigit():
+            conditions.append(User.id == int(search))
+        query = query.filter(or_(*conditions))
+    if role_filter:
+        query = query.filter(func.lower(User.role) == role_filter)
+    filtered = bool(search or role_filter)
+    pagination = query.order_by(User.id.desc()).paginate(
+        page=page, per_page=USERS_PER_PAGE, error_out=False, count=filtered
+    )
+    if not filtered:
+        # The cached stats already hold the unfiltered count.
+        pagination.total = total_users
+    pagination_args = {k: v for k, v in request.args.items() if k != "page" and v}
     return render_template(
         "users/list.html",
-        users=users,
+        users=pagination.items,
         total_users=total_users,
-        active_users=active_users,
-        inactive_users=inactive_users,
-        role_breakdown=role_breakdown,
+        active_users=stats["active_users"],
+        inactive_users=stats["inactive_users"],
+        role_breakdown=stats["role_breakdown"],
+        pagination=pagination,
+        pagination_args=pagination_args,
+        search=search,
+        role_filter=role_filter,
+    )
+
+
+@users_bp.route("/users/export.csv", methods=["GET"])
+@login_required
+@role_required('admin', 'manager')
+def export_users_csv():
+    """Stream every user as CSV without buffering the whole table in memory."""
+    stmt = (
+        select(
+            User.id,
+            User.full_name,
+            User.username,
+            User.email,
+            User.role,
+            User.department,
+            User.active,
+            User.created_at,
+        )
+        .order_by(User.id)
+        .execution_options(yield_per=USERS_EXPORT_CHUNK)
+    )
+
+    def generate():
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(["ID", "Full Name", "Username", "Email", "Role", "Department", "Active", "Created"])
+        for chunk in db.session.execute(stmt).partitions():
+            for row in chunk:
+                writer.writerow([
+                    row.id,
+                    row.full_name or "",
+                    row.username,
+                    row.email,
+                    row.role or "",
+                    row.department or "",
+                    "yes" if row.active else "no",
+                    row.created_at.strftime("%Y-%m-%d %H:%M") if row.created_at else "",
+                ])
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+        tail = buffer.getvalue()
+        if tail:
+            yield tail
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype="text/csv",
+        headers={"Content-Disposition": "attachment; filename=helpdesk_users.csv"},
     )
 
 
@@ -89,9 +273,6 @@ def add_user():
     if password != password_confirm:
         return jsonify(success=False, message="Passwords do not match"), 400
 
-    if User.query.filter((func.lower(User.username) == username.lower()) | (func.lower(User.email) == email.lower())).first():
-        return jsonify(success=False, message="User already exists"), 400
-
     ok, messages = validate_password_strength(password)
     if not ok:
         return jsonify(success=False, message=" ".join(messages)), 400
@@ -109,14 +290,21 @@ def add_user():
         full_name=full_name or None,
         role=role,
         department=department,
-        active=active_value in {"1", "true", "on", "yes"},
+        active=active_value in _TRUTHY,
         notify_team_ticket_email=notify_email,
         notify_team_ticket_teams=notify_teams,
         teams_webhook_url=teams_webhook_url or None,
     )
     user.set_password(password)
     db.session.add(user)
-    db.session.commit()
+    # The case-insensitive unique indexes reject duplicates atomically; no pre-check SELECT.
+    try:
+        db.session.commit()
+    except IntegrityError as exc:
+        db.session.rollback()
+        if not _is_duplicate_user_error(exc):
+            raise
+        return jsonify(success=False, message="User already exists"), 400
     return jsonify(success=True, message="User created successfully")
 
 
@@ -124,12 +312,12 @@ def add_user():
 @login_required
 @role_required('admin', 'manager')
 def edit_user(id):
-    user = User.query.get_or_404(id)
     if current_user.role != 'admin' and current_user.id != id:
         abort(403)
+    user = User.query.get_or_404(id)
 
     new_username = request.form.get("username", "").strip()
-    new_email = request.form.get("email", "").strip()
+    new_email = request.form.get("email", "").strip().lower()
     new_full_name = request.form.get("full_name", user.full_name or "").strip()
     new_role = request.form.get("role", user.role)
     new_department = request.form.get("department", user.department)
@@ -144,11 +332,16 @@ def edit_user(id):
     if not new_username or not new_email:
         return jsonify(success=False, message="Username and email are required"), 400
 
-    # Prevent duplicate usernames
-    if User.query.filter(func.lower(User.username) == new_username.lower(), User.id != id).first():
+    # Prevent duplicate usernames/emails with one lookup, then report which clashed
+    username_key = new_username.lower()
+    email_key = new_email
+    conflicts = db.session.execute(
+        _EDIT_CONFLICT_STMT,
+        {"username_key": username_key, "email_key": email_key, "user_id": id},
+    ).all()
+    if any(row[0] == username_key for row in conflicts):
         return jsonify(success=False, message=f"Username '{new_username}' already exists"), 400
-
-    if User.query.filter(func.lower(User.email) == new_email.lower(), User.id != id).first():
+    if conflicts:
         return jsonify(success=False, message=f"Email '{new_email}' already exists"), 400
 
     user.username = new_username
@@ -156,7 +349,7 @@ def edit_user(id):
     user.full_name = new_full_name or None
     user.role = new_role
     user.department = new_department
-    user.active = active_value in {"1", "true", "on", "yes"}
+    user.active = active_value in _TRUTHY
     if user.role != "manager":
         user.notify_team_ticket_email = False
         user.notify_team_ticket_teams = False
@@ -187,7 +380,10 @@ def _avatar_upload_folder() -> str:
     folder = current_app.config.get("AVATAR_UPLOAD_FOLDER")
     if not folder:
         folder = os.path.join(current_app.static_folder, "uploads", "avatars")
-    os.makedirs(folder, exist_ok=True)
+    # Each folder is created at most once per process.
+    if folder not in _avatar_folders_ready:
+        os.makedirs(folder, exist_ok=True)
+        _avatar_folders_ready.add(folder)
     return folder
 
 
@@ -202,8 +398,9 @@ def _remove_avatar_file(filename: str) -> None:
              os.path.join(_legacy_avatar_folder(), filename)]
     for path in paths:
         try:
-            if os.path.isfile(path):
-                os.remove(path)
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
         except OSError:
             current_app.logger.warning("Failed to remove avatar file %s", path, exc_info=True)
 
@@ -211,6 +408,10 @@ def _remove_avatar_file(filename: str) -> None:
 @users_bp.route("/profile", methods=["POST"])
 @login_required
 def update_profile():
+    # Refuse oversized bodies before Werkzeug parses (and spools) the multipart form.
+    if request.content_length and request.content_length > MAX_PROFILE_FORM_SIZE:
+        return jsonify(success=False, message="Profile image must be smaller than 5MB."), 413
+
     user = current_user
     full_name = (request.form.get("full_name") or "").strip()
     email = (request.form.get("email") or "").strip().lower()
@@ -218,8 +419,8 @@ def update_profile():
     if not email:
         return jsonify(success=False, message="Email is required."), 400
 
-    duplicate_email = (
-        User.query.filter(func.lower(User.email) == email.lower(), User.id != user.id).first()
+    duplicate_email = db.session.scalar(
+        select(exists().where(User.email == email, User.id != user.id))
     )
     if duplicate_email:
         return jsonify(success=False, message="Another account already uses that email address."), 400
@@ -252,8 +453,7 @@ def update_profile():
             filename_root = f"user_{user.id}_{int(time.time())}"
             extension = avatar_file.filename.rsplit(".", 1)[1].lower()
             filename = secure_filename(f"{filename_root}.{extension}", allow_unicode=True)
-            upload_folder = _avatar_upload_folder()
-            upload_path = os.path.join(upload_folder, filename)
+            upload_path = os.path.join(_avatar_upload_folder(), filename)
             avatar_file.save(upload_path)
             if user.avatar_filename and user.avatar_filename != filename:
                 _remove_avatar_file(user.avatar_filename)
@@ -289,10 +489,11 @@ def update_profile():
     if user.avatar_filename:
         new_path = os.path.join(_avatar_upload_folder(), user.avatar_filename)
         legacy_path = os.path.join(_legacy_avatar_folder(), user.avatar_filename)
-        if not os.path.isfile(new_path) and os.path.isfile(legacy_path):
-            os.makedirs(os.path.dirname(new_path), exist_ok=True)
+        if not os.path.isfile(new_path):
             try:
                 shutil.move(legacy_path, new_path)
+            except FileNotFoundError:
+                pass
             except OSError:
                 current_app.logger.warning("Failed to migrate legacy avatar %s", legacy_path, exc_info=True)
 
@@ -325,10 +526,118 @@ def update_profile():
     )
 
 
+# (model or raw table name, column, action) applied when a user is deleted, in order.
+#   "delete"           - remove rows pointing at the user
+#   "nullify"          - clear the reference
+#   "reassign"         - hand over to the acting admin; left untouched when there is none
+#   "reassign_or_null" - hand over to the acting admin, or clear the reference
+_USER_CLEANUP_STEPS = (
+    # Assistant sessions and related documents/messages
+    (AssistantDocument, "user_id", "delete"),
+    (AssistantSession, "user_id", "delete"),
+    # Tickets
+    (Ticket, "assigned_to", "nullify"),
+    (Ticket, "created_by", "reassign"),
+    # Knowledge base
+    (KnowledgeArticle, "created_by", "reassign"),
+    (KnowledgeArticle, "updated_by", "reassign"),
+    (KnowledgeArticleVersion, "created_by", "reassign"),
+    (KnowledgeAttachment, "uploaded_by", "nullify"),
+    # Inventory assets
+    (SoftwareAsset, "assigned_to", "nullify"),
+    (HardwareAsset, "assigned_to", "nullify"),
+    # Contracts
+    (Contract, "owner_id", "nullify"),
+    # API clients
+    (ApiClient, "default_user_id", "reassign_or_null"),
+    # Email ingest configurations
+    (EmailIngestConfig, "created_by_user_id", "reassign"),
+    (EmailIngestConfig, "assign_to_user_id", "nullify"),
+    # Menu permissions
+    (MenuPermission, "user_id", "delete"),
+    # Backup module
+    (TapeLocation, "created_by_user_id", "reassign_or_null"),
+    (TapeCustodyEvent, "created_by_user_id", "reassign_or_null"),
+    (BackupAuditLog, "changed_by_user_id", "reassign_or_null"),
+    # Collaboration / chat
+    (ChatMessageRead, "user_id", "delete"),
+    (ChatMembership, "user_id", "delete"),
+    (ChatFavorite, "user_id", "delete"),
+    (ChatFavorite, "favorite_user_id", "delete"),
+    (ChatMessage, "sender_id", "delete"),
+    (ChatConversation, "created_by", "reassign_or_null"),
+    # Backup jobs (raw table not mapped)
+    ("backup_job", "responsible_user_id", "reassign_or_null"),
+)
+
+
+def _schema_handles(schema_actions: frozenset, target, column: str, nulls: bool) -> bool:
+    """True when the live FK on `target.column` already deletes/nulls rows on user deletion."""
+    wanted = "SET NULL" if nulls else "CASCADE"
+    return (target.__table__.name, column, wanted) in schema_actions
+
+
+def _raw_table_exists(bind, name: str) -> bool:
+    """Look up whether an unmapped table exists, using the flag probed at app startup."""
+    config_key = f"HAS_{name.upper()}_TABLE"
+    present = current_app.config.get(config_key)
+    if present is None:
+        present = inspect(bind).has_table(name)
+        current_app.config[config_key] = present
+    return present
+
+
+def _cleanup_statements(acting_id, bind) -> tuple:
+    """Return the Core statements for `_USER_CLEANUP_STEPS`, bound to `uid` / `replacement`."""
+    raw_tables = frozenset(
+        target
+        for target, _column, _action in _USER_CLEANUP_STEPS
+        if isinstance(target, str) and _raw_table_exists(bind, target)
+    )
+    return _build_cleanup_statements(acting_id is not None, fk_actions(bind), raw_tables)
+
+
+@lru_cache(maxsize=16)
+def _build_cleanup_statements(reassign: bool, schema_actions: frozenset, raw_tables: frozenset) -> tuple:
+    # Only a handful of shapes exist, so each is built once and reused across deletions.
+    statements = []
+    for target, column, action in _USER_CLEANUP_STEPS:
+        if action == "reassign" and not reassign:
+            continue
+        if isinstance(target, str):
+            if target not in raw_tables:
+                continue
+            table = sa_table(target, sa_column(column))
+        else:
+            table = target.__table__
+        nulls = action == "nullify" or (action == "reassign_or_null" and not reassign)
+        if (
+            not isinstance(target, str)
+            and (action == "delete" or nulls)
+            and _schema_handles(schema_actions, target, column, nulls)
+        ):
+            continue
+        col = table.c[column]
+        if action == "delete":
+            statements.append(delete(table).where(col == bindparam("uid")))
+            continue
+        value = null() if nulls else bindparam("replacement")
+        statements.append(update(table).where(col == bindparam("uid")).values({column: value}))
+    return tuple(statements)
+
+
+@lru_cache(maxsize=16)
+def _cleanup_script(statements: tuple, dialect) -> str:
+    """Compile a statement tuple into one ';'-separated driver-level script."""
+    return ";\n".join(str(stmt.compile(dialect=dialect)) for stmt in statements)
+
+
 def _cleanup_user_relationships(target: User, acting: User) -> None:
     """
     Prepare related records so that deleting `target` will not violate FK constraints.
     Reassign ownership metadata to the acting admin when possible and nullify optional links.
+    FK ON DELETE actions found in the live schema take care of their dependent rows, and with
+    psycopg2 the remaining statements go to the server in a single round-trip.
     """
 
     acting_id = acting.id if acting and isinstance(acting.id, int) else None
@@ -339,116 +648,20 @@ def _cleanup_user_relationships(target: User, acting: User) -> None:
         # but guard to avoid rewriting ownership to the same record.
         acting_id = None
 
-    # Assistant sessions and related documents/messages
-    AssistantDocument.query.filter_by(user_id=user_id).delete(synchronize_session=False)
-    AssistantSession.query.filter_by(user_id=user_id).delete(synchronize_session=False)
-
-    # Tickets
-    Ticket.query.filter_by(assigned_to=user_id).update(
-        {Ticket.assigned_to: None}, synchronize_session=False
-    )
-    if acting_id:
-        Ticket.query.filter_by(created_by=user_id).update(
-            {Ticket.created_by: acting_id}, synchronize_session=False
-        )
-
-    # Knowledge base
-    if acting_id:
-        KnowledgeArticle.query.filter_by(created_by=user_id).update(
-            {KnowledgeArticle.created_by: acting_id}, synchronize_session=False
-        )
-        KnowledgeArticle.query.filter_by(updated_by=user_id).update(
-            {KnowledgeArticle.updated_by: acting_id}, synchronize_session=False
-        )
-        KnowledgeArticleVersion.query.filter_by(created_by=user_id).update(
-            {KnowledgeArticleVersion.created_by: acting_id}, synchronize_session=False
-        )
-    KnowledgeAttachment.query.filter_by(uploaded_by=user_id).update(
-        {KnowledgeAttachment.uploaded_by: None}, synchronize_session=False
-    )
-
-    # Inventory assets
-    SoftwareAsset.query.filter_by(assigned_to=user_id).update(
-        {SoftwareAsset.assigned_to: None}, synchronize_session=False
-    )
-    HardwareAsset.query.filter_by(assigned_to=user_id).update(
-        {HardwareAsset.assigned_to: None}, synchronize_session=False
-    )
-
-    # Contracts
-    Contract.query.filter_by(owner_id=user_id).update(
-        {Contract.owner_id: None}, synchronize_session=False
-    )
-
-    # API clients
-    ApiClient.query.filter_by(default_user_id=user_id).update(
-        {"default_user_id": acting_id}, synchronize_session=False
-    )
-
-    # Email ingest configurations
-    updates = {}
-    updates_assign = {}
-    if acting_id:
-        updates["created_by_user_id"] = acting_id
-    updates_assign["assign_to_user_id"] = None
-    if updates:
-        EmailIngestConfig.query.filter_by(created_by_user_id=user_id).update(
-            updates, synchronize_session=False
-        )
-    EmailIngestConfig.query.filter_by(assign_to_user_id=user_id).update(
-        updates_assign, synchronize_session=False
-    )
-
-    # Menu permissions
-    MenuPermission.query.filter_by(user_id=user_id).delete(synchronize_session=False)
-
-    # Backup module
-    replacement = acting_id if acting_id else None
-    TapeLocation.query.filter_by(created_by_user_id=user_id).update(
-        {"created_by_user_id": replacement}, synchronize_session=False
-    )
-    TapeCustodyEvent.query.filter_by(created_by_user_id=user_id).update(
-        {"created_by_user_id": replacement}, synchronize_session=False
-    )
-    BackupAuditLog.query.filter_by(changed_by_user_id=user_id).update(
-        {"changed_by_user_id": replacement}, synchronize_session=False
-    )
-
-    # Collaboration / chat
-    ChatMessageRead.query.filter_by(user_id=user_id).delete(synchronize_session=False)
-    ChatMembership.query.filter_by(user_id=user_id).delete(synchronize_session=False)
-    ChatFavorite.query.filter(
-        or_(ChatFavorite.user_id == user_id, ChatFavorite.favorite_user_id == user_id)
-    ).delete(synchronize_session=False)
-
-    ChatMessage.query.filter_by(sender_id=user_id).delete(synchronize_session=False)
-    ChatConversation.query.filter_by(created_by=user_id).update(
-        {"created_by": acting_id}, synchronize_session=False
-    )
-
-    # Backup jobs (raw table not mapped)
-    replacement = acting_id if acting_id is not None else None
-    bind = db.session.get_bind()
-    if bind is not None:
-        inspector = inspect(bind)
-        if inspector.has_table("backup_job"):
-            if replacement is not None:
-                db.session.execute(
-                    text(
-                        "UPDATE backup_job SET responsible_user_id = :replacement WHERE responsible_user_id = :uid"
-                    ),
-                    {"replacement": replacement, "uid": user_id},
-                )
-            else:
-                db.session.execute(
-                    text(
-                        "UPDATE backup_job SET responsible_user_id = NULL WHERE responsible_user_id = :uid"
-                    ),
-                    {"uid": user_id},
-                )
-
-    # Flush to ensure pending deletes/updates reflected before actual delete
+    # Flush pending ORM changes first; the Core statements below bypass the session.
     db.session.flush()
+    bind = db.session.get_bind()
+    statements = _cleanup_statements(acting_id, bind)
+    params = {"uid": user_id, "replacement": acting_id}
+    if not statements:
+        return
+    if bind.dialect.driver == "psycopg2":
+        # psycopg2 interpolates parameters client-side, so several ';'-separated statements
+        # can go in one execute call; psycopg 3 binds server-side and refuses that.
+        db.session.connection().exec_driver_sql(_cleanup_script(statements, bind.dialect), params)
+    else:
+        for statement in statements:
+            db.session.execute(statement, params)
 
 
 @users_bp.route("/users/<int:id>/delete", methods=["POST"])
@@ -8,7 +8,6 @@ def init_demo_data():
         admin = User(username='admin', email='admin@helpdesk.local', full_name='Demo Administrator', role='admin')
         admin.set_password('ChangeMe123!@')
         db.session.add(admin)
-        db.session.commit()
 
     if not Ticket.query.first():
         demo_tickets = [
@@ -16,6 +15,6 @@ def init_demo_data():
             Ticket(subject='Email not syncing', description='Outlook fails to sync inbox', priority='Medium', department='Support', created_by='admin'),
             Ticket(subject='VPN connection drops', description='Random disconnections during work', priority='Low', department='Network', created_by='admin')
         ]
-        for t in demo_tickets:
-            db.session.add(t)
-        db.session.commit()
+        db.session.add_all(demo_tickets)
+
+    db.session.commit()
@@ -1,10 +1,15 @@
-import unicodedata
 import re
+import string
+import unicodedata
+from functools import lru_cache
 from typing import Final
 
 from werkzeug.utils import secure_filename as _secure_filename
 
 _FILENAME_STRIP_RE: Final = re.compile(r"[^\w.-]", re.UNICODE)
+# ASCII fast path equivalent to _FILENAME_STRIP_RE: \w is [A-Za-z0-9_] for ASCII input.
+_ASCII_KEEP: Final = frozenset(string.ascii_letters + string.digits + "_.-")
+_ASCII_TRANSLATE: Final = bytes(c if chr(c) in _ASCII_KEEP else ord("_") for c in range(256))
 
 
 def secure_filename(filename: str, allow_unicode: bool = False) -> str:
@@ -23,8 +28,14 @@ def secure_filename(filename: str, allow_unicode: bool = False) -> str:
         return cleaned or _secure_filename(filename)
 
 
+# Repeated names (batch imports, re-uploads of the same file) skip the NFKC/regex work.
+@lru_cache(maxsize=2048)
 def _sanitize_unicode_filename(filename: str) -> str:
-    value = str(filename).strip().replace("\\", " ")
+    value = str(filename).strip()
+    if value.isascii():
+        # NFKC leaves ASCII untouched; path separators map to "_" like the spaces below.
+        return value.encode("ascii").translate(_ASCII_TRANSLATE).decode("ascii").lstrip("._")
+    value = value.replace("\\", " ")
     value = value.replace("/", " ")
     value = unicodedata.normalize("NFKC", value)
     value = _FILENAME_STRIP_RE.sub("_", value)
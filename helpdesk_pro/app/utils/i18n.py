@@ -13,6 +13,7 @@ without requiring an on-disk compilation step.
 from __future__ import annotations
 
 import os
+import threading
 from io import BytesIO
 from typing import Iterable
 
@@ -20,6 +21,12 @@ from babel.messages import mofile, pofile
 from flask_babel import Domain, _get_current_context, get_locale, support
 
 
+# Catalogues compiled from .po files, shared by every app/domain in the process.
+# Keyed on the file's mtime so an edited .po is recompiled on the next load.
+_PO_CACHE: dict[tuple[str, float], support.Translations] = {}
+_PO_CACHE_LOCK = threading.Lock()
+
+
 class PoFallbackDomain(Domain):
     """Load translations, compiling .po files in-memory when .mo is absent."""
 
@@ -30,17 +37,33 @@ class PoFallbackDomain(Domain):
         """
 
         try:
-            return support.Translations.load(directory, [locale], domain)
+            compiled = support.Translations.load(directory, [locale], domain)
+        except OSError:
+            compiled = None
+        # Babel returns NullTranslations rather than raising when no .mo exists.
+        if isinstance(compiled, support.Translations):
+            return compiled
+
+        po_path = os.path.join(directory, str(locale), "LC_MESSAGES", f"{domain}.po")
+        try:
+            cache_key = (po_path, os.path.getmtime(po_path))
         except OSError:
-            po_path = os.path.join(directory, str(locale), "LC_MESSAGES", f"{domain}.po")
-            if not os.path.exists(po_path):
-                raise
-            with open(po_path, "r", encoding="utf-8") as handle:
-                catalog = pofile.read_po(handle)
-            buffer = BytesIO()
-            mofile.write_mo(buffer, catalog)
-            buffer.seek(0)
-            return support.Translations(fp=buffer)
+            if compiled is not None:
+                return compiled
+            raise
+        with _PO_CACHE_LOCK:
+            cached = _PO_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+        with open(po_path, "r", encoding="utf-8") as handle:
+            catalog = pofile.read_po(handle)
+        buffer = BytesIO()
+        mofile.write_mo(buffer, catalog)
+        buffer.seek(0)
+        translations = support.Translations(fp=buffer)
+        with _PO_CACHE_LOCK:
+            _PO_CACHE[cache_key] = translations
+        return translations
 
     def _iter_domains(self) -> Iterable[tuple[str, str]]:
         """
@@ -8,12 +8,14 @@ def role_required(*roles):
     Restrict access to users whose role is in the given list.
     Example: @role_required('admin', 'manager')
     """
+    allowed = frozenset(r.lower() for r in roles)
+
     def decorator(f):
         @wraps(f)
         def wrapper(*args, **kwargs):
             if not current_user.is_authenticated:
                 abort(403)
-            if current_user.role.lower() not in [r.lower() for r in roles]:
+            if (current_user.role or "").lower() not in allowed:
                 abort(403)
             return f(*args, **kwargs)
         return wrapper
@@ -0,0 +1,30 @@
+from flask import current_app
+from sqlalchemy import inspect
+
+# Dialects that enforce declared foreign keys; SQLite ships with enforcement disabled.
+FK_ENFORCING_DIALECTS = frozenset({"postgresql"})
+
+
+def probe_fk_actions(bind) -> frozenset:
+    """
+    Read the ON DELETE actions the live database enforces, as (table, column, action)
+    triples for single-column foreign keys. Empty when the dialect does not enforce FKs.
+    """
+    if bind.dialect.name not in FK_ENFORCING_DIALECTS:
+        return frozenset()
+    actions = set()
+    for (_schema, table), fks in inspect(bind).get_multi_foreign_keys().items():
+        for fk in fks:
+            ondelete = (fk.get("options") or {}).get("ondelete")
+            if ondelete and len(fk["constrained_columns"]) == 1:
+                actions.add((table, fk["constrained_columns"][0], ondelete.upper()))
+    return frozenset(actions)
+
+
+def fk_actions(bind) -> frozenset:
+    """Return the FK actions probed at app startup, probing now if that did not happen."""
+    actions = current_app.config.get("FK_ON_DELETE_ACTIONS")
+    if actions is None:
+        actions = probe_fk_actions(bind)
+        current_app.config["FK_ON_DELETE_ACTIONS"] = actions
+    return actions
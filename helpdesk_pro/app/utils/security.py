@@ -1,11 +1,17 @@
-import base64, os, sys, re, hashlib
+import base64, os, sys, hashlib, string
 from typing import List, Tuple, Optional
 from cryptography.fernet import Fernet
 from flask import current_app, has_app_context
-if sys.platform.startswith('win'):
+_IS_WIN = sys.platform.startswith('win')
+if _IS_WIN:
     import win32crypt
 
 _FERNET_INSTANCE: Optional[Fernet] = None
+_FERNET_PREFIX = 'fernet:'
+_ASCII_UPPER = frozenset(string.ascii_uppercase)
+_ASCII_LOWER = frozenset(string.ascii_lowercase)
+_ASCII_DIGITS = frozenset(string.digits)
+_ASCII_ALNUM = _ASCII_UPPER | _ASCII_LOWER | _ASCII_DIGITS
 
 
 def _get_fernet() -> Fernet:
@@ -13,46 +19,46 @@ def _get_fernet() -> Fernet:
     if _FERNET_INSTANCE is not None:
         return _FERNET_INSTANCE
     key = os.environ.get('FERNET_KEY')
-    has_ctx = has_app_context()
-    if not key and has_ctx:
-        key = current_app.config.get('FERNET_KEY')
+    cfg = current_app.config if has_app_context() else None
+    if not key and cfg is not None:
+        key = cfg.get('FERNET_KEY')
     if not key:
         seed = os.environ.get('SECRET_KEY')
-        if not seed and has_ctx:
-            seed = current_app.config.get('SECRET_KEY')
+        if not seed and cfg is not None:
+            seed = cfg.get('SECRET_KEY')
         if seed:
-            digest = hashlib.sha256(seed.encode()).digest()
+            seed_bytes = seed if isinstance(seed, (bytes, bytearray)) else seed.encode('utf-8')
+            digest = hashlib.sha256(seed_bytes).digest()
             key = base64.urlsafe_b64encode(digest).decode()
     if not key:
         raise RuntimeError(
             "FERNET_KEY is not configured and no SECRET_KEY available to derive one."
         )
-    if has_ctx and key and not current_app.config.get('FERNET_KEY'):
-        current_app.config['FERNET_KEY'] = key.decode() if isinstance(key, bytes) else key
+    if cfg is not None and not cfg.get('FERNET_KEY'):
+        cfg['FERNET_KEY'] = key.decode() if isinstance(key, bytes) else key
     key_bytes = key.encode() if isinstance(key, str) else key
     _FERNET_INSTANCE = Fernet(key_bytes)
     return _FERNET_INSTANCE
 
 
 def encrypt_secret(secret: str) -> str:
-    if sys.platform.startswith('win'):
+    if _IS_WIN:
         data = win32crypt.CryptProtectData(secret.encode(), None, None, None, None, 0)
         return base64.b64encode(data[1]).decode()
     else:
         token = _get_fernet().encrypt(secret.encode()).decode()
-        return 'fernet:' + token
+        return _FERNET_PREFIX + token
 
 def decrypt_secret(token: str) -> str:
-    if token.startswith('fernet:'):
-        parts = token.split(':', 2)
+    if token.startswith(_FERNET_PREFIX):
+        rest = token[len(_FERNET_PREFIX):]
+        colon = rest.find(':')
+        if colon == -1:
+            return _get_fernet().decrypt(rest.encode()).decode()
         # Legacy format stored the key alongside the ciphertext.
-        if len(parts) == 3:
-            _, key, enc = parts
-            f = Fernet(key.encode())
-            return f.decrypt(enc.encode()).decode()
-        _, enc = parts
-        return _get_fernet().decrypt(enc.encode()).decode()
-    if sys.platform.startswith('win'):
+        f = Fernet(rest[:colon].encode())
+        return f.decrypt(rest[colon + 1:].encode()).decode()
+    if _IS_WIN:
         data = base64.b64decode(token)
         return win32crypt.CryptUnprotectData(data, None, None, None, 0)[1].decode()
     return token
@@ -72,14 +78,16 @@ def validate_password_strength(password: str) -> Tuple[bool, List[str]]:
         password = ""
     if len(password) < 12:
         errors.append("Password must be at least 12 characters long.")
-    if not re.search(r"[A-Z]", password):
+    # One pass to collect the distinct characters; the class checks are C-level set ops.
+    chars = set(password)
+    if chars.isdisjoint(_ASCII_UPPER):
         errors.append("Password must include at least one uppercase letter.")
-    if not re.search(r"[a-z]", password):
+    if chars.isdisjoint(_ASCII_LOWER):
         errors.append("Password must include at least one lowercase letter.")
-    if not re.search(r"[0-9]", password):
+    if chars.isdisjoint(_ASCII_DIGITS):
         errors.append("Password must include at least one number.")
-    if not re.search(r"[^A-Za-z0-9]", password):
+    if chars <= _ASCII_ALNUM:
         errors.append("Password must include at least one symbol.")
-    if re.search(r"\s", password):
+    if any(map(str.isspace, chars)):
         errors.append("Password cannot contain whitespace characters.")
     return len(errors) == 0, errors
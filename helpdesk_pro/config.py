@@ -4,6 +4,9 @@ from datetime import timedelta
 from dotenv import load_dotenv
 load_dotenv()
 
+# Relative folder defaults are resolved against the launch directory.
+_CWD = os.getcwd()
+
 
 def _float_env(key: str, default: float) -> float:
     try:
@@ -25,11 +28,24 @@ def _list_env(key: str, default: list[str]) -> list[str]:
     return [item.strip() for item in raw.split(",") if item.strip()]
 
 
+def _engine_options(database_uri: str | None) -> dict:
+    options = {
+        "pool_pre_ping": True,
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", 1800)),
+    }
+    # SQLite's single-connection pools reject queue sizing arguments.
+    if not (database_uri or "").startswith("sqlite"):
+        options["pool_size"] = int(os.getenv("DB_POOL_SIZE", 10))
+        options["max_overflow"] = int(os.getenv("DB_MAX_OVERFLOW", 20))
+    return options
+
+
 class Config:
     SECRET_KEY = os.getenv('SECRET_KEY')
     SQLALCHEMY_DATABASE_URI = os.getenv('SQLALCHEMY_DATABASE_URI')
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     SQLALCHEMY_ECHO = os.getenv('SQLALCHEMY_ECHO', 'False').lower() == 'true'
+    SQLALCHEMY_ENGINE_OPTIONS = _engine_options(SQLALCHEMY_DATABASE_URI)
     MAIL_SERVER = os.getenv('MAIL_SERVER')
     MAIL_PORT = int(os.getenv('MAIL_PORT', 587))
     MAIL_USE_TLS = os.getenv('MAIL_USE_TLS', 'True').lower() == 'true'
@@ -45,20 +61,27 @@ class Config:
     if LOG_FILE_LEVEL:
         LOG_FILE_LEVEL = LOG_FILE_LEVEL.upper()
     JWT_SECRET_KEY = os.getenv('JWT_SECRET_KEY') or SECRET_KEY
-    UPLOAD_FOLDER = os.path.join(os.getcwd(), 'uploads')
+    UPLOAD_FOLDER = os.path.join(_CWD, 'uploads')
     MAX_CONTENT_LENGTH = 16 * 1024 * 1024
     BASE_URL = os.getenv('BASE_URL')
+    TICKET_NOTIFY_ENABLED = os.getenv('TICKET_NOTIFY_ENABLED', 'True').lower() not in {
+        '0', 'false', 'no'}
+    TICKET_NOTIFY_ROLES = _list_env(
+        'TICKET_NOTIFY_ROLES', ['user', 'technician', 'manager'])
     SECURITY_HEADERS = {
         "Content-Security-Policy": "default-src 'self'; img-src 'self' data:;",
         "X-Frame-Options": "DENY",
         "Strict-Transport-Security": "max-age=63072000; includeSubDomains; preload"
     }
     KNOWLEDGE_UPLOAD_FOLDER = os.path.join(
-        os.getcwd(), 'instance', 'knowledge_uploads')
+        _CWD, 'instance', 'knowledge_uploads')
     COLLAB_UPLOAD_FOLDER = os.path.join(
-        os.getcwd(), 'instance', 'chat_uploads')
+        _CWD, 'instance', 'chat_uploads')
     ASSISTANT_UPLOAD_FOLDER = os.path.join(
-        os.getcwd(), 'instance', 'assistant_uploads')
+        _CWD, 'instance', 'assistant_uploads')
+    TICKETS_ACCEL_REDIRECT_PREFIX = os.getenv('TICKETS_ACCEL_REDIRECT_PREFIX')
+    TICKETS_UPLOAD_FSYNC = os.getenv('TICKETS_UPLOAD_FSYNC', 'False').lower() in {
+        '1', 'true', 'yes'}
 
     LANGUAGES = ['en', 'el']
     BABEL_DEFAULT_LOCALE = 'en'
@@ -93,10 +116,10 @@ class Config:
     FLEET_INGEST_ENABLED = os.getenv('FLEET_INGEST_ENABLED', 'True').lower() not in {'0', 'false', 'no'}
     FLEET_INGEST_HOST = os.getenv('FLEET_INGEST_HOST', '0.0.0.0')
     FLEET_INGEST_PORT = int(os.getenv('FLEET_INGEST_PORT', 8449))
-    FLEET_UPLOAD_FOLDER = os.path.join(os.getcwd(), 'instance', 'fleet_uploads')
+    FLEET_UPLOAD_FOLDER = os.path.join(_CWD, 'instance', 'fleet_uploads')
     FLEET_AGENT_INSTALLER_PATH = os.getenv(
         'FLEET_AGENT_INSTALLER_PATH',
-        os.path.join(os.getcwd(), 'instance', 'Telemetry_Agent.msi'),
+        os.path.join(_CWD, 'instance', 'Telemetry_Agent.msi'),
     )
     FLEET_AGENT_INSTALLER_MAX_BYTES = int(os.getenv('FLEET_AGENT_INSTALLER_MAX_BYTES', 100 * 1024 * 1024))
     FLEET_AGENT_LINK_DEFAULT_TTL_DAYS = int(os.getenv('FLEET_AGENT_LINK_DEFAULT_TTL_DAYS', 7))
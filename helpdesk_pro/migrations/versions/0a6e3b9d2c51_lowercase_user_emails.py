@@ -0,0 +1,26 @@
+"""store user emails lowercased
+
+Revision ID: 0a6e3b9d2c51
+Revises: f2c8d5a1e7b9
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0a6e3b9d2c51"
+down_revision = "f2c8d5a1e7b9"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # uq_user_email_ci already guarantees no two rows differ only by case.
+    op.execute(sa.text('UPDATE "user" SET email = lower(email) WHERE email <> lower(email)'))
+
+
+def downgrade():
+    # The original casing is not recoverable; lowercased addresses stay valid.
+    pass
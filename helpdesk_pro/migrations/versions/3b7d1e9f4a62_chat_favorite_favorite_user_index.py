@@ -0,0 +1,25 @@
+"""index chat_favorite.favorite_user_id
+
+Revision ID: 3b7d1e9f4a62
+Revises: 0a6e3b9d2c51
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "3b7d1e9f4a62"
+down_revision = "0a6e3b9d2c51"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_chat_favorite_favorite_user_id", "chat_favorite", ["favorite_user_id"], unique=False
+    )
+
+
+def downgrade():
+    op.drop_index("ix_chat_favorite_favorite_user_id", table_name="chat_favorite")
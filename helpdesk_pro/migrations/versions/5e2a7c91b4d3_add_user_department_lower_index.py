@@ -0,0 +1,24 @@
+"""add lower(department) index on user
+
+Revision ID: 5e2a7c91b4d3
+Revises: 1c35ffc409e8
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "5e2a7c91b4d3"
+down_revision = "1c35ffc409e8"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index("ix_user_dept_lower", "user", [sa.text("lower(department)")], unique=False)
+
+
+def downgrade():
+    op.drop_index("ix_user_dept_lower", table_name="user")
@@ -0,0 +1,24 @@
+"""add department index on user
+
+Revision ID: 8b3d6f2e1a47
+Revises: 5e2a7c91b4d3
+Create Date: 2026-10-18 10:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "8b3d6f2e1a47"
+down_revision = "5e2a7c91b4d3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index("ix_user_department", "user", ["department"], unique=False)
+
+
+def downgrade():
+    op.drop_index("ix_user_department", table_name="user")
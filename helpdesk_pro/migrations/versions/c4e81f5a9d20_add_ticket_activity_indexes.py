@@ -0,0 +1,34 @@
+"""add ticket activity composite indexes
+
+Revision ID: c4e81f5a9d20
+Revises: 8b3d6f2e1a47
+Create Date: 2026-10-18 11:15:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "c4e81f5a9d20"
+down_revision = "8b3d6f2e1a47"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_ticket_comment_ticket_created", "ticket_comment", ["ticket_id", "created_at"], unique=False
+    )
+    op.create_index(
+        "ix_attachment_ticket_uploaded", "attachment", ["ticket_id", "uploaded_at"], unique=False
+    )
+    op.create_index(
+        "ix_audit_log_ticket_timestamp", "audit_log", ["ticket_id", "timestamp"], unique=False
+    )
+
+
+def downgrade():
+    op.drop_index("ix_audit_log_ticket_timestamp", table_name="audit_log")
+    op.drop_index("ix_attachment_ticket_uploaded", table_name="attachment")
+    op.drop_index("ix_ticket_comment_ticket_created", table_name="ticket_comment")
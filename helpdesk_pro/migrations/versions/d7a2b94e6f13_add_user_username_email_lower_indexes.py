@@ -0,0 +1,26 @@
+"""add lower(username) and lower(email) indexes on user
+
+Revision ID: d7a2b94e6f13
+Revises: c4e81f5a9d20
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "d7a2b94e6f13"
+down_revision = "c4e81f5a9d20"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index("ix_user_username_lower", "user", [sa.text("lower(username)")], unique=False)
+    op.create_index("ix_user_email_lower", "user", [sa.text("lower(email)")], unique=False)
+
+
+def downgrade():
+    op.drop_index("ix_user_email_lower", table_name="user")
+    op.drop_index("ix_user_username_lower", table_name="user")
@@ -0,0 +1,69 @@
+"""add ON DELETE actions to foreign keys referencing user
+
+Revision ID: e5f9a3c7b2d8
+Revises: d7a2b94e6f13
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "e5f9a3c7b2d8"
+down_revision = "d7a2b94e6f13"
+branch_labels = None
+depends_on = None
+
+
+# (table, column, ON DELETE action)
+USER_FOREIGN_KEYS = (
+    ("ticket", "assigned_to", "SET NULL"),
+    ("knowledge_attachment", "uploaded_by", "SET NULL"),
+    ("software_asset", "assigned_to", "SET NULL"),
+    ("hardware_asset", "assigned_to", "SET NULL"),
+    ("contract", "owner_id", "SET NULL"),
+    ("api_client", "default_user_id", "SET NULL"),
+    ("email_ingest_config", "assign_to_user_id", "SET NULL"),
+    ("backup_tape_location", "created_by_user_id", "SET NULL"),
+    ("backup_tape_custody", "created_by_user_id", "SET NULL"),
+    ("backup_audit_log", "changed_by_user_id", "SET NULL"),
+    ("chat_conversation", "created_by", "SET NULL"),
+    ("menu_permission", "user_id", "CASCADE"),
+    ("chat_membership", "user_id", "CASCADE"),
+    ("chat_message", "sender_id", "CASCADE"),
+    ("chat_message_read", "user_id", "CASCADE"),
+    ("chat_favorite", "user_id", "CASCADE"),
+    ("chat_favorite", "favorite_user_id", "CASCADE"),
+)
+
+
+def _replace_user_foreign_keys(with_actions):
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        # SQLite cannot alter constraints in place; the application-level
+        # cleanup in users.routes still covers those databases.
+        return
+    inspector = sa.inspect(bind)
+    for table, column, action in USER_FOREIGN_KEYS:
+        if not inspector.has_table(table):
+            continue
+        for fk in inspector.get_foreign_keys(table):
+            if fk["referred_table"] == "user" and fk["constrained_columns"] == [column]:
+                op.drop_constraint(fk["name"], table, type_="foreignkey")
+        op.create_foreign_key(
+            f"{table}_{column}_fkey",
+            table,
+            "user",
+            [column],
+            ["id"],
+            ondelete=action if with_actions else None,
+        )
+
+
+def upgrade():
+    _replace_user_foreign_keys(True)
+
+
+def downgrade():
+    _replace_user_foreign_keys(False)
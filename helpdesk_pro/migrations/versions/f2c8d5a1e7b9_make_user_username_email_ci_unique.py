@@ -0,0 +1,30 @@
+"""make lower(username) and lower(email) indexes on user unique
+
+Revision ID: f2c8d5a1e7b9
+Revises: e5f9a3c7b2d8
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "f2c8d5a1e7b9"
+down_revision = "e5f9a3c7b2d8"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.drop_index("ix_user_email_lower", table_name="user")
+    op.drop_index("ix_user_username_lower", table_name="user")
+    op.create_index("uq_user_username_ci", "user", [sa.text("lower(username)")], unique=True)
+    op.create_index("uq_user_email_ci", "user", [sa.text("lower(email)")], unique=True)
+
+
+def downgrade():
+    op.drop_index("uq_user_email_ci", table_name="user")
+    op.drop_index("uq_user_username_ci", table_name="user")
+    op.create_index("ix_user_username_lower", "user", [sa.text("lower(username)")], unique=False)
+    op.create_index("ix_user_email_lower", "user", [sa.text("lower(email)")], unique=False)